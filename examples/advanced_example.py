@@ -4,11 +4,31 @@ Advanced example with async functions, complex schemas, and more features.
 
 import asyncio
 import json
+import statistics
+import time
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import Dict, List, Optional
 
 from unified_server import UnifiedServer, tool, resource, prompt, ServerConfig
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Below this size the NumPy conversion costs more than it saves
+NUMPY_MIN_SIZE = 64
+
+try:
+    import psutil
+    psutil.cpu_percent(interval=None)  # Prime the counter so later non-blocking reads are meaningful
+except ImportError:
+    psutil = None
+
+# System status snapshots are reused for this many seconds
+STATUS_TTL = 0.5
+_status_cache = {"t": 0.0, "data": None}
+
 
 # Create server with custom configuration
 config = ServerConfig(
@@ -68,12 +88,14 @@ async def fetch_data(endpoint: str, timeout: int = 5) -> Dict:
 )
 def search_database(query: str, filters: Optional[Dict] = None, limit: int = 10) -> List[Dict]:
     """Search database with complex filtering"""
+    category = filters.get("category", "general") if filters else "general"
+    
     # Simulate database search
     results = [
         {
             "id": i,
             "title": f"Item matching '{query}' #{i}",
-            "category": filters.get("category", "general") if filters else "general",
+            "category": category,
             "price": 10.0 + i,
             "in_stock": True
         }
@@ -98,17 +120,35 @@ def calculate_stats(numbers: List[float]) -> Dict:
     if not numbers:
         raise ValueError("Numbers list cannot be empty")
     
-    sorted_numbers = sorted(numbers)
     n = len(numbers)
     
+    if np is not None and n >= NUMPY_MIN_SIZE:
+        arr = np.asarray(numbers, dtype=np.float64)
+        total = float(arr.sum())
+        low = float(arr.min())
+        high = float(arr.max())
+        return {
+            "count": n,
+            "sum": total,
+            "mean": total / n,
+            "median": float(np.median(arr)),
+            "min": low,
+            "max": high,
+            "range": high - low
+        }
+    
+    total = sum(numbers)
+    low = min(numbers)
+    high = max(numbers)
+    
     return {
         "count": n,
-        "sum": sum(numbers),
-        "mean": sum(numbers) / n,
-        "median": sorted_numbers[n // 2] if n % 2 else (sorted_numbers[n // 2 - 1] + sorted_numbers[n // 2]) / 2,
-        "min": min(numbers),
-        "max": max(numbers),
-        "range": max(numbers) - min(numbers)
+        "sum": total,
+        "mean": total / n,
+        "median": statistics.median(numbers),
+        "min": low,
+        "max": high,
+        "range": high - low
     }
 
 
@@ -118,23 +158,37 @@ def calculate_stats(numbers: List[float]) -> Dict:
     description="Real-time system status",
     mime_type="application/json"
 )
-def get_system_status():
+async def get_system_status():
     """Get current system status"""
-    import psutil
+    now = time.monotonic()
+    if _status_cache["data"] is None or now - _status_cache["t"] > STATUS_TTL:
+        # Even non-blocking psutil probes are syscalls; keep them off the event loop
+        _status_cache["data"] = await asyncio.to_thread(_probe_system_status)
+        _status_cache["t"] = now
+    return _status_cache["data"]
+
+
+def _probe_system_status():
+    """Take one snapshot of CPU, memory and disk usage"""
+    if psutil is None:
+        raise RuntimeError("psutil is required for system status")
+    
+    memory = psutil.virtual_memory()
+    disk = psutil.disk_usage('/')
     
     return {
         "timestamp": datetime.now().isoformat(),
-        "cpu_percent": psutil.cpu_percent(interval=1),
+        "cpu_percent": psutil.cpu_percent(interval=None),
         "memory": {
-            "total": psutil.virtual_memory().total,
-            "available": psutil.virtual_memory().available,
-            "percent": psutil.virtual_memory().percent
+            "total": memory.total,
+            "available": memory.available,
+            "percent": memory.percent
         },
         "disk": {
-            "total": psutil.disk_usage('/').total,
-            "used": psutil.disk_usage('/').used,
-            "free": psutil.disk_usage('/').free,
-            "percent": psutil.disk_usage('/').percent
+            "total": disk.total,
+            "used": disk.used,
+            "free": disk.free,
+            "percent": disk.percent
         }
     }
 
@@ -147,9 +201,10 @@ def get_system_status():
 async def get_async_feed():
     """Get data from async source"""
     await asyncio.sleep(0.3)
+    now = datetime.now().isoformat()
     return {
         "items": [
-            {"id": i, "title": f"Item {i}", "timestamp": datetime.now().isoformat()}
+            {"id": i, "title": f"Item {i}", "timestamp": now}
             for i in range(5)
         ]
     }
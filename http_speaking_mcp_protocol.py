@@ -1,63 +1,106 @@
 import httpx
 import asyncio
+import itertools
 import json
 
+try:
+    import uvloop
+except ImportError:  # uvloop is unavailable on Windows; fall back to stock asyncio
+    uvloop = None
+
+try:
+    import orjson
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj, separators=(",", ":")).encode()
+    _loads = json.loads
+
 class MCPClient:
     def __init__(self, base_url):
         self.base_url = base_url.rstrip('/')
+        # One pooled client for the lifetime of MCPClient keeps connections alive between calls
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers={"Content-Type": "application/json"},
+            timeout=30,
+        )
+        # Monotonic JSON-RPC ids so responses can be matched to requests
+        self._next_id = itertools.count(1).__next__
+        # Only the id of the tools/list envelope changes, so encode the rest once
+        self._list_tools_prefix = _dumps({
+            "jsonrpc": "2.0",
+            "method": "tools/list"
+        })[:-1] + b',"id":'
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+    async def aclose(self):
+        await self._client.aclose()
         
     async def call_tool(self, tool_name, arguments):
-        async with httpx.AsyncClient() as client:
-            # MCP tool call request
-            mcp_request = {
+        # MCP tool call request
+        mcp_request = {
+            "jsonrpc": "2.0",
+            "id": self._next_id(),
+            "method": "tools/call",
+            "params": {
+                "name": tool_name,
+                "arguments": arguments
+            }
+        }
+        
+        response = await self._client.post("/mcp", content=_dumps(mcp_request))
+        
+        result = _loads(response.content)
+        return result["result"]["content"][0]["text"]
+    
+    async def call_batch(self, calls):
+        """Call several tools in one JSON-RPC batch; results come back in call order"""
+        batch = [
+            {
                 "jsonrpc": "2.0",
-                "id": 1,
+                "id": self._next_id(),
                 "method": "tools/call",
-                "params": {
-                    "name": tool_name,
-                    "arguments": arguments
-                }
+                "params": {"name": name, "arguments": arguments}
             }
-            
-            response = await client.post(
-                f"{self.base_url}/mcp",
-                json=mcp_request,
-                headers={"Content-Type": "application/json"}
-            )
-            
-            result = response.json()
-            return result["result"]["content"][0]["text"]
+            for name, arguments in calls
+        ]
+        
+        response = await self._client.post("/mcp", content=_dumps(batch))
+        
+        by_id = {item["id"]: item for item in _loads(response.content)}
+        return [
+            by_id[request["id"]]["result"]["content"][0]["text"]
+            for request in batch
+        ]
     
     async def list_tools(self):
-        async with httpx.AsyncClient() as client:
-            mcp_request = {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "tools/list"
-            }
-            
-            response = await client.post(
-                f"{self.base_url}/mcp",
-                json=mcp_request
-            )
-            
-            return response.json()["result"]["tools"]
+        body = self._list_tools_prefix + str(self._next_id()).encode() + b"}"
+        response = await self._client.post("/mcp", content=body)
+        
+        return _loads(response.content)["result"]["tools"]
 
 async def main():
-    client = MCPClient("http://localhost:8002")
-    
-    # List available tools
-    tools = await client.list_tools()
-    print("Available tools:", [tool["name"] for tool in tools])
-    
-    # Call tools
-    result = await client.call_tool("add", {"a": 15, "b": 27})
-    print("Addition:", result)
-    
-    result = await client.call_tool("list_tables", {
-        "db_type": "postgres", 
-        "db_name": "kmp"
-    })
-    print("Tables:", result)
+    async with MCPClient("http://localhost:8002") as client:
+        # List available tools
+        tools = await client.list_tools()
+        print("Available tools:", [tool["name"] for tool in tools])
+        
+        # Call tools (one round trip for both)
+        addition, tables = await client.call_batch([
+            ("add", {"a": 15, "b": 27}),
+            ("list_tables", {"db_type": "postgres", "db_name": "kmp"}),
+        ])
+        print("Addition:", addition)
+        print("Tables:", tables)
 
-asyncio.run(main())
+if uvloop is not None:
+    uvloop.run(main())
+else:
+    asyncio.run(main())
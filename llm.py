@@ -1,8 +1,17 @@
+import functools
 import os
 from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+
+@functools.lru_cache(maxsize=1)
+def _load_env() -> None:
+    """Load environment variables from .env once, on first use."""
+    load_dotenv()
+
+
+def _get_key(name: str) -> str | None:
+    _load_env()
+    return os.getenv(name)
 
 # ----------------------------------------------------------------------
 # GOOGLE LLM SETUP
@@ -14,14 +23,13 @@ except ImportError:
     ChatGoogleGenerativeAI = None
     genai = None
 
-GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
-
 def get_google_llm(model_name: str = "gemini-2.5-flash-preview-05-20", **kwargs):
     """Return a Google Gemini LLM (via LangChain)."""
     if not genai or not ChatGoogleGenerativeAI:
         raise ImportError("Please install google-generativeai and langchain-google-genai.")
-    genai.configure(api_key=GOOGLE_API_KEY)
-    return ChatGoogleGenerativeAI(model=model_name, google_api_key=GOOGLE_API_KEY, **kwargs)
+    google_api_key = _get_key("GOOGLE_API_KEY")
+    genai.configure(api_key=google_api_key)
+    return ChatGoogleGenerativeAI(model=model_name, google_api_key=google_api_key, **kwargs)
 
 
 # ----------------------------------------------------------------------
@@ -32,14 +40,12 @@ try:
 except ImportError:
     ChatOpenAI = None
 
-OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY")
-
 def get_openrouter_llm(model_name: str = "deepseek/deepseek-chat-v3.1:free", **kwargs):
     """Return an OpenRouter LLM (via LangChain)."""
     if not ChatOpenAI:
         raise ImportError("Please install langchain-openai.")
     return ChatOpenAI(
-        openai_api_key=OPENROUTER_API_KEY,
+        openai_api_key=_get_key("OPENROUTER_API_KEY"),
         openai_api_base="https://openrouter.ai/api/v1",
         model_name=model_name,
         **kwargs,
@@ -49,10 +55,17 @@ def get_openrouter_llm(model_name: str = "deepseek/deepseek-chat-v3.1:free", **k
 # ----------------------------------------------------------------------
 # UNIFIED ACCESS POINT
 # ----------------------------------------------------------------------
+# Constructed LLM clients keyed by (provider, model_name, sorted kwargs)
+_llm_cache: dict = {}
+
+
 def get_llm(provider: str = "google", model_name: str | None = None, **kwargs):
     """
     Get an LLM instance by provider and optional model.
     
+    Instances are cached, so repeated calls with the same provider, model and
+    kwargs return the same client instead of re-initializing the SDK.
+    
     Args:
         provider: "google" | "openrouter"
         model_name: optional, overrides the default model for the provider
@@ -63,22 +76,40 @@ def get_llm(provider: str = "google", model_name: str | None = None, **kwargs):
     if provider == "google":
         if model_name is None:
             model_name = "gemini-2.5-flash-preview-05-20"  # default Google model
-        return get_google_llm(model_name=model_name, **kwargs)
+        factory = get_google_llm
     
     elif provider == "openrouter":
         if model_name is None:
             model_name = "deepseek/deepseek-chat-v3.1:free"  # default OpenRouter model
-        return get_openrouter_llm(model_name=model_name, **kwargs)
+        factory = get_openrouter_llm
     
     else:
         raise ValueError("Provider must be 'google' or 'openrouter'.")
+    
+    key = (provider, model_name, tuple(sorted(kwargs.items())))
+    try:
+        return _llm_cache[key]
+    except KeyError:
+        pass
+    except TypeError:
+        # Unhashable kwargs (e.g. a dict of headers): build without caching
+        return factory(model_name=model_name, **kwargs)
+    
+    instance = _llm_cache[key] = factory(model_name=model_name, **kwargs)
+    return instance
 
 
 # ----------------------------------------------------------------------
 # DEFAULT INSTANCE 
 # ----------------------------------------------------------------------
-llm = get_llm(provider="google")  # default Google model
-# or llm = get_llm(provider="openrouter", model_name="deepseek-chat-v3.0:free")
+def __getattr__(name: str):
+    """Build the default ``llm`` and read API keys on first access instead of at import time."""
+    if name == "llm":
+        # or get_llm(provider="openrouter", model_name="deepseek-chat-v3.0:free")
+        return get_llm(provider="google")  # default Google model (cached by get_llm)
+    if name in ("GOOGLE_API_KEY", "OPENROUTER_API_KEY"):
+        return _get_key(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 """
@@ -10,4 +10,7 @@ setup(
     packages=find_packages(where="src"),
     package_dir={"": "src"},
     python_requires=">=3.9",
+    extras_require={
+        "speedups": ["orjson>=3.9.0", "fastjsonschema>=2.19.0", "google-re2>=1.1"],
+    },
 )
\ No newline at end of file
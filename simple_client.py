@@ -1,10 +1,9 @@
 from dotenv import load_dotenv
 from langchain_core.messages import AnyMessage
-from langchain_core.messages.utils import count_tokens_approximately, trim_messages
+from langchain_core.messages.utils import count_tokens_approximately
 from langchain_core.tools import StructuredTool
 from langchain_openai import ChatOpenAI
 from langchain_mcp_adapters.tools import load_mcp_tools
-from langchain_mcp_adapters.resources import load_mcp_resources
 from langchain_mcp_adapters.prompts import load_mcp_prompt
 from langgraph.checkpoint.memory import InMemorySaver
 from langgraph.prebuilt import create_react_agent
@@ -14,15 +13,50 @@ from mcp.client.streamable_http import streamablehttp_client
 from pydantic import BaseModel, Field
 from langchain.prompts import ChatPromptTemplate, MessagesPlaceholder
 import asyncio
-from dotenv import load_dotenv
+import functools
+import json
+import sys
+import httpx
+
+try:
+    from aioconsole import ainput
+except ImportError:  # aioconsole is optional; read stdin in a worker thread instead
+    async def ainput(prompt: str = "") -> str:
+        return await asyncio.to_thread(input, prompt)
+
+try:
+    import h2  # noqa: F401  # enables HTTP/2 in httpx
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
 
-load_dotenv()
+try:
+    import uvloop
+except ImportError:  # uvloop is unavailable on Windows; fall back to stock asyncio
+    uvloop = None
 
 # -------------------
 # Server Parameters
 # -------------------
 server_url = "http://localhost:8000/mcp"  #"http://localhost:8000/mcp"
 
+def http_client_factory(
+    headers: dict[str, str] | None = None,
+    timeout: httpx.Timeout | None = None,
+    auth: httpx.Auth | None = None,
+) -> httpx.AsyncClient:
+    """
+    httpx client for the MCP session: keeps connections alive between calls
+    and negotiates HTTP/2 (over TLS) when h2 is installed.
+    """
+    return httpx.AsyncClient(
+        headers=headers,
+        timeout=timeout or httpx.Timeout(30, read=300),
+        auth=auth,
+        http2=HTTP2_AVAILABLE,
+        limits=httpx.Limits(max_keepalive_connections=32, keepalive_expiry=60),
+    )
+
 # -------------------
 # Resource Listing Tool (NEW!)
 # -------------------
@@ -66,25 +100,34 @@ async def fetch_mcp_resource(uri: str, session: ClientSession) -> str:
     Fetch an MCP resource by URI and return its data as a string.
     """
     try:
-        resources = await load_mcp_resources(session, uris=[uri])
-        if not resources:
+        result = await session.read_resource(uri)
+        if not result.contents:
             return f"No resource found for URI: {uri}"
-        return str(resources[0].data)
+        content = result.contents[0]
+        return str(getattr(content, "text", None) or getattr(content, "blob", ""))
     except Exception as e:
         return f"Error fetching resource {uri}: {str(e)}"
 
+class FetchResourcesInput(BaseModel):
+    uris: list[str] = Field(description="The MCP resource URIs to fetch in one call")
+
+async def fetch_mcp_resources(uris: list[str], session: ClientSession) -> str:
+    """
+    Fetch several MCP resources concurrently and return a JSON object mapping
+    each URI to its data (or error message).
+    """
+    results = await asyncio.gather(*(fetch_mcp_resource(uri, session) for uri in uris))
+    return json.dumps(dict(zip(uris, results)), ensure_ascii=False)
+
 # -------------------
 # Dynamic Tool Creation
 # -------------------
-async def create_resource_tools(session: ClientSession) -> list[StructuredTool]:
+def create_resource_tools(session: ClientSession) -> list[StructuredTool]:
     """Create both list and fetch resource tools"""
     
     # List resources tool
-    async def bound_list_resources() -> str:
-        return await list_available_resources(session)
-    
     list_tool = StructuredTool.from_function(
-        func=bound_list_resources,
+        coroutine=functools.partial(list_available_resources, session),
         name="list_mcp_resources",
         description=(
             "List all available MCP resources from the server. "
@@ -92,15 +135,11 @@ async def create_resource_tools(session: ClientSession) -> list[StructuredTool]:
         ),
         args_schema=ListResourcesInput,
         return_direct=False,
-        coroutine=bound_list_resources,
     )
     
     # Fetch resource tool
-    async def bound_fetch_resource(uri: str) -> str:
-        return await fetch_mcp_resource(uri, session)
-    
     fetch_tool = StructuredTool.from_function(
-        func=bound_fetch_resource,
+        coroutine=functools.partial(fetch_mcp_resource, session=session),
         name="fetch_mcp_resource",
         description=(
             "Fetch an MCP resource by its URI and return its content. "
@@ -109,83 +148,165 @@ async def create_resource_tools(session: ClientSession) -> list[StructuredTool]:
         ),
         args_schema=FetchResourceInput,
         return_direct=False,
-        coroutine=bound_fetch_resource,
     )
     
-    return [list_tool, fetch_tool]
+    # Batch fetch tool
+    fetch_many_tool = StructuredTool.from_function(
+        coroutine=functools.partial(fetch_mcp_resources, session=session),
+        name="fetch_mcp_resources",
+        description=(
+            "Fetch several MCP resources at once by their URIs. "
+            "Prefer this over repeated fetch_mcp_resource calls when you need more than one resource."
+        ),
+        args_schema=FetchResourcesInput,
+        return_direct=False,
+    )
+    
+    return [list_tool, fetch_tool, fetch_many_tool]
+
+# -------------------
+# System Prompt
+# -------------------
+DEFAULT_SYSTEM_PROMPT = "You are a helpful assistant with access to MCP tools and resources."
+
+async def load_system_prompt(session: ClientSession) -> str:
+    """Load the server's system prompt, falling back to a default (optional)"""
+    try:
+        mcp_prompts = await load_mcp_prompt(session, "system_prompt")
+        return mcp_prompts[0].content if mcp_prompts else DEFAULT_SYSTEM_PROMPT
+    except Exception:
+        return DEFAULT_SYSTEM_PROMPT
+
+RESOURCE_INSTRUCTIONS = (
+    "\n\n**Important Instructions for Resources:**"
+    "\n1. When asked about available data or resources, FIRST use 'list_mcp_resources' to discover what's available"
+    "\n2. After finding the URI you need, use 'fetch_mcp_resource' with that specific URI"
+    "\n   (use 'fetch_mcp_resources' to fetch several URIs in one call)"
+    "\n3. Resource URIs available: 'config://app/settings', 'file://docs/readme', etc."
+    "\n\nAlways list resources before trying to fetch them!"
+)
+
+MESSAGES_PLACEHOLDER = MessagesPlaceholder("messages")
+
+@functools.lru_cache(maxsize=2)
+def build_prompt_template(base_system_prompt: str) -> ChatPromptTemplate:
+    """Build (once per base prompt) the agent's chat prompt template."""
+    return ChatPromptTemplate.from_messages([
+        ("system", base_system_prompt + RESOURCE_INSTRUCTIONS),
+        MESSAGES_PLACEHOLDER,
+    ])
 
 # -------------------
 # Config + Hooks
 # -------------------
 CONFIG = {"configurable": {"thread_id": "1"}}
 
+MAX_HISTORY_TOKENS = 30_000
+
+# Token counts per message id; history messages are immutable once added
+_token_counts: dict[str, int] = {}
+
+def _cached_count(message: AnyMessage) -> int:
+    """Approximate token count for one message, memoized by message id."""
+    key = message.id
+    if key is None:
+        return count_tokens_approximately([message])
+    try:
+        return _token_counts[key]
+    except KeyError:
+        n = _token_counts[key] = count_tokens_approximately([message])
+        return n
+
 def pre_model_hook(state: AgentState) -> dict[str, list[AnyMessage]]:
     """
     Trim messages before LLM invocation to manage token limits.
+
+    Equivalent to trim_messages(strategy="last", include_system=True,
+    start_on="human", end_on=("human", "tool")), but only counts tokens for
+    messages it has not seen before.
     """
-    trimmed_messages = trim_messages(
-        state["messages"],
-        strategy="last",
-        token_counter=count_tokens_approximately,
-        max_tokens=30_000,
-        start_on="human",
-        end_on=("human", "tool"),
-        include_system=True,
-    )
-    return {"llm_input_messages": trimmed_messages}
+    messages = state["messages"]
+    system = messages[:1] if messages and messages[0].type == "system" else []
+    history = messages[len(system):]
+
+    # end_on: the window must end on a human or tool message
+    end = len(history)
+    while end and history[end - 1].type not in ("human", "tool"):
+        end -= 1
+
+    # Walk back from the tail while the budget allows
+    budget = MAX_HISTORY_TOKENS - sum(map(_cached_count, system))
+    start = end
+    while start:
+        n = _cached_count(history[start - 1])
+        if n > budget:
+            break
+        budget -= n
+        start -= 1
+
+    # start_on: the window must begin on a human message
+    while start < end and history[start].type != "human":
+        start += 1
+
+    return {"llm_input_messages": system + history[start:end]}
 
 async def print_astream(async_stream, output_messages_key: str = "llm_input_messages") -> None:
     """
     Print the stream of messages from the agent.
+
+    Chunks are handed to a printer task through a bounded queue, so stdout
+    writes overlap with waiting on the agent; each chunk is written at once.
     """
-    async for chunk in async_stream:
-        for node, update in chunk.items():
-            print(f"Update from node: {node}")
-            messages_key = output_messages_key if node == "pre_model_hook" else "messages"
-            for message in update[messages_key]:
-                if isinstance(message, tuple):
-                    print(message)
-                else:
-                    message.pretty_print()
-        print("\n\n")
+    queue: asyncio.Queue = asyncio.Queue(maxsize=64)
+
+    async def produce() -> None:
+        async for chunk in async_stream:
+            await queue.put(chunk)
+        await queue.put(None)
+
+    async def consume() -> None:
+        while (chunk := await queue.get()) is not None:
+            parts = []
+            for node, update in chunk.items():
+                parts.append(f"Update from node: {node}")
+                messages_key = output_messages_key if node == "pre_model_hook" else "messages"
+                for message in update[messages_key]:
+                    parts.append(str(message) if isinstance(message, tuple) else message.pretty_repr())
+            parts.append("\n\n")
+            sys.stdout.write("\n".join(parts) + "\n")
+            sys.stdout.flush()
+
+    async with asyncio.TaskGroup() as tg:
+        tg.create_task(produce())
+        tg.create_task(consume())
 
 # -------------------
 # Main entry
 # -------------------
 async def main():
-    async with streamablehttp_client(server_url) as (read, write, _):
+    load_dotenv()
+
+    # Let coroutines that finish without suspending skip the event-loop queue (3.12+)
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
+    async with streamablehttp_client(server_url, httpx_client_factory=http_client_factory) as (read, write, _):
         async with ClientSession(read, write) as session:
             await session.initialize()
 
-            # Load MCP tools
-            mcp_tools = await load_mcp_tools(session)
+            # Load MCP tools and the system prompt concurrently
+            mcp_tools, base_system_prompt = await asyncio.gather(
+                load_mcp_tools(session),
+                load_system_prompt(session),
+            )
             
             print(f"✅ Loaded {len(mcp_tools)} MCP tools")
 
-            # Load system prompt (optional)
-            try:
-                mcp_prompts = await load_mcp_prompt(session, "system_prompt")
-                base_system_prompt = mcp_prompts[0].content if mcp_prompts else \
-                    "You are a helpful assistant with access to MCP tools and resources."
-            except:
-                base_system_prompt = "You are a helpful assistant with access to MCP tools and resources."
-            
-            system_prompt = base_system_prompt + (
-                "\n\n**Important Instructions for Resources:**"
-                "\n1. When asked about available data or resources, FIRST use 'list_mcp_resources' to discover what's available"
-                "\n2. After finding the URI you need, use 'fetch_mcp_resource' with that specific URI"
-                "\n3. Resource URIs available: 'config://app/settings', 'file://docs/readme', etc."
-                "\n\nAlways list resources before trying to fetch them!"
-            )
-
             # Prompt template
-            prompt_template = ChatPromptTemplate.from_messages([
-                ("system", system_prompt),
-                MessagesPlaceholder("messages"),
-            ])
+            prompt_template = build_prompt_template(base_system_prompt)
 
             # Create resource tools (list + fetch)
-            resource_tools = await create_resource_tools(session)
+            resource_tools = create_resource_tools(session)
             allowed_tools = mcp_tools + resource_tools
             
             print(f"✅ Total tools available: {len(allowed_tools)}")
@@ -234,7 +355,7 @@ async def main():
             print("💡 Tip: Try asking 'What resources are available?' or 'List all schemas'\n")
             
             while True:
-                user_input = input("> ")
+                user_input = await ainput("> ")
                 if user_input.lower() in {"exit", "quit", "q"}:
                     break
 
@@ -244,4 +365,7 @@ async def main():
                 )
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
\ No newline at end of file
@@ -1,9 +1,13 @@
 import asyncio
 import os
+import sys
+import time
+import weakref
+from collections import OrderedDict
+import httpx
 from dotenv import load_dotenv
 from pydantic import BaseModel, Field
-from langchain_core.messages import AnyMessage
-from langchain_core.messages.utils import count_tokens_approximately, trim_messages
+from langchain_core.messages import AIMessage, ToolMessage
 from langchain_core.tools import StructuredTool
 from langchain_openai import ChatOpenAI
 from langchain_mcp_adapters.tools import load_mcp_tools
@@ -12,173 +16,259 @@ from langchain_mcp_adapters.prompts import load_mcp_prompt
 from langchain.prompts import ChatPromptTemplate, MessagesPlaceholder
 from langgraph.prebuilt import create_react_agent
 from langgraph.checkpoint.memory import InMemorySaver
-from langgraph.prebuilt.chat_agent_executor import AgentState
 from mcp import ClientSession
 from mcp.client.streamable_http import streamablehttp_client
 from colorama import Fore, Style, init
 
+# History trimming is shared with the v1 client rather than copied here
+from simple_client import pre_model_hook
+
+try:
+    import h2  # noqa: F401  # enables HTTP/2 in httpx
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 init(autoreset=True)
 load_dotenv()
 
 SERVER_URL = "http://localhost:8000/mcp"
 CONFIG = {"configurable": {"thread_id": "1"}}
 
-# --------------------------
-# Hooks
-# --------------------------
-def pre_model_hook(state: AgentState) -> dict[str, list[AnyMessage]]:
-    """Trim messages before LLM invocation"""
-    trimmed_messages = trim_messages(
-        state["messages"],
-        strategy="last",
-        token_counter=count_tokens_approximately,
-        max_tokens=30_000,
-        start_on="human",
-        end_on=("human", "tool"),
-        include_system=True,
-    )
-    return {"llm_input_messages": trimmed_messages}
+# Resource content cache (URI -> (fetched_at, content)), LRU-ordered
+CACHE_TTL = float(os.getenv("MCP_RESOURCE_CACHE_TTL", "300"))
+MAX_ENTRIES = int(os.getenv("MCP_RESOURCE_CACHE_MAX_ENTRIES", "1000"))
+resource_cache: OrderedDict[str, tuple[float, str]] = OrderedDict()
+
+# Binary resource payloads are cut to this many bytes before formatting
+MAX_RESOURCE_BYTES = 64 * 1024
 
 # --------------------------
 # Resource Fetching Tool
 # --------------------------
 class FetchResourceInput(BaseModel):
-    uri: str = Field(description="The MCP resource URI to fetch (e.g., 'schema://table/users')")
+    uris: list[str] = Field(
+        description="One or more MCP resource URIs to fetch (e.g., ['schema://table/users'])"
+    )
+
+async def fetch_one_resource(uri: str, session: ClientSession) -> str:
+    """Fetch a specific MCP resource by URI (served from cache when fresh)"""
+    cached = resource_cache.get(uri)
+    if cached is not None and time.monotonic() - cached[0] < CACHE_TTL:
+        resource_cache.move_to_end(uri)
+        return cached[1]
 
-async def fetch_mcp_resource(uri: str, session: ClientSession) -> str:
-    """Fetch a specific MCP resource by URI"""
     try:
         resources = await load_mcp_resources(session, uris=[uri])
         if not resources:
             return f"❌ No resource found for URI: {uri}"
-        return str(resources[0].data)
+        data = resources[0].data
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            # Slice binary payloads before stringifying them
+            data = data[:MAX_RESOURCE_BYTES]
+        content = str(data)
     except Exception as e:
         return f"❌ Error fetching resource {uri}: {str(e)}"
 
+    # Only successful reads are cached
+    resource_cache[uri] = (time.monotonic(), content)
+    resource_cache.move_to_end(uri)
+    while len(resource_cache) > MAX_ENTRIES:
+        resource_cache.popitem(last=False)
+    return content
+
+async def fetch_mcp_resource(uris: list[str], session: ClientSession) -> str:
+    """Fetch MCP resources concurrently; one section per URI"""
+    results = await asyncio.gather(*(fetch_one_resource(uri, session) for uri in uris))
+    if len(results) == 1:
+        return results[0]
+    return "\n\n".join(f"### {uri}\n{content}" for uri, content in zip(uris, results))
+
 async def create_fetch_tool(session: ClientSession) -> StructuredTool:
     """Create the fetch resource tool"""
-    async def bound_fetch_resource(uri: str) -> str:
-        return await fetch_mcp_resource(uri, session)
+    async def bound_fetch_resource(uris: list[str]) -> str:
+        return await fetch_mcp_resource(uris, session)
 
     return StructuredTool.from_function(
         func=bound_fetch_resource,
         name="fetch_mcp_resource",
         description=(
-            "Fetch the content of a specific MCP resource by its URI. "
-            "Available URIs are listed in the system prompt."
+            "Fetch the content of one or more MCP resources by URI. "
+            "Pass every URI you need in a single call; they are fetched in parallel. "
+            "Call list_resources first to see the available URIs."
         ),
         args_schema=FetchResourceInput,
         return_direct=False,
         coroutine=bound_fetch_resource,
     )
 
+class ListResourcesInput(BaseModel):
+    """No input needed"""
+
+def create_list_tool(session: ClientSession) -> StructuredTool:
+    """Create the list resources tool (served from the per-session listing cache)"""
+    async def bound_list_resources() -> str:
+        return await get_available_resources(session)
+
+    return StructuredTool.from_function(
+        func=bound_list_resources,
+        name="list_resources",
+        description="List the URIs, names and descriptions of all available MCP resources.",
+        args_schema=ListResourcesInput,
+        return_direct=False,
+        coroutine=bound_list_resources,
+    )
+
 # --------------------------
 # Pre-load Resources
 # --------------------------
+# Resource listings per session; the server's resource set is fixed for a session
+_resource_listings: "weakref.WeakKeyDictionary[ClientSession, str]" = weakref.WeakKeyDictionary()
+
 async def get_available_resources(session: ClientSession) -> str:
     """Get a formatted list of all available resources"""
+    listing = _resource_listings.get(session)
+    if listing is None:
+        listing = await _list_resources(session)
+        if not listing.startswith("Error"):
+            _resource_listings[session] = listing
+    return listing
+
+_RESOURCES_HEADER = "📚 AVAILABLE RESOURCES:\n\n"
+
+async def _list_resources(session: ClientSession) -> str:
     try:
         result = await session.list_resources()
         if not result or not result.resources:
             return "No resources available."
         
-        output = "📚 AVAILABLE RESOURCES:\n\n"
-        for res in result.resources:
-            output += f"  • URI: {res.uri}\n"
-            output += f"    Name: {res.name}\n"
-            if res.description:
-                output += f"    Description: {res.description}\n"
-            output += "\n"
-        return output
+        lines = [_RESOURCES_HEADER]
+        lines.extend(
+            f"  • URI: {res.uri}\n"
+            f"    Name: {res.name}\n"
+            + (f"    Description: {res.description}\n" if res.description else "")
+            + "\n"
+            for res in result.resources
+        )
+        return "".join(lines)
     except Exception as e:
         return f"Error loading resources: {str(e)}"
 
+# --------------------------
+# System Prompt
+# --------------------------
+DEFAULT_SYSTEM_PROMPT = "You are a helpful assistant."
+
+async def load_system_prompt(session: ClientSession) -> str:
+    """Load the server's system prompt, falling back to a default"""
+    try:
+        mcp_prompts = await load_mcp_prompt(session, "system_prompt")
+        return mcp_prompts[0].content if mcp_prompts else DEFAULT_SYSTEM_PROMPT
+    except Exception:
+        return DEFAULT_SYSTEM_PROMPT
+
 # --------------------------
 # Stream printer with tool tracking
 # --------------------------
+_TOOL_CALL_TMPL = (
+    f"{Fore.YELLOW}🔧 Calling tool: {Fore.GREEN}{{name}}{Style.RESET_ALL}\n"
+    f"{Fore.YELLOW}   Args: {Fore.WHITE}{{args}}{Style.RESET_ALL}\n\n"
+)
+_TOOL_RESULT_TMPL = f"{Fore.YELLOW}✅ Tool result: {Fore.WHITE}{{content}}{Style.RESET_ALL}\n\n"
+_RULE = f"{Fore.CYAN}{'='*60}{Style.RESET_ALL}"
+_FINAL_ANSWER_TMPL = f"{Fore.WHITE}{{answer}}{Style.RESET_ALL}\n"
+_TOOLS_USED_TMPL = f"{Fore.MAGENTA}📊 Tools used: {{names}}{Style.RESET_ALL}\n"
+
+def _on_ai(msg: AIMessage, buf: list[str], tool_calls: list) -> str | None:
+    """Record tool calls; return the content of a final (tool-free) answer"""
+    if not msg.tool_calls:
+        return msg.content
+    for tool_call in msg.tool_calls:
+        tool_name = tool_call.get("name", "unknown")
+        tool_args = tool_call.get("args", {})
+        tool_calls.append((tool_name, tool_args))
+        buf.append(_TOOL_CALL_TMPL.format(name=tool_name, args=tool_args))
+    return None
+
+def _on_tool(msg: ToolMessage, buf: list[str], tool_calls: list) -> None:
+    """Record a (truncated) tool result"""
+    raw = msg.content
+    content = raw if isinstance(raw, str) else str(raw)
+    if len(content) > 300:
+        content = content[:300] + "..."
+    buf.append(_TOOL_RESULT_TMPL.format(content=content))
+
+_MESSAGE_HANDLERS = {AIMessage: _on_ai, ToolMessage: _on_tool}
+
 async def print_stream_with_tools(agent, initial_state, config):
     """Print agent stream and track tool calls"""
-    print(f"\n{Fore.CYAN}{'='*60}{Style.RESET_ALL}")
+    print(f"\n{_RULE}")
     
     tool_calls = []
     final_response = None
     
     async for chunk in agent.astream(initial_state, config=config, stream_mode="updates"):
+        buf: list[str] = []
         for node, update in chunk.items():
-            messages = update.get("messages", [])
-            
-            for msg in messages:
-                # Track tool calls
-                if hasattr(msg, "tool_calls") and msg.tool_calls:
-                    for tool_call in msg.tool_calls:
-                        tool_name = tool_call.get("name", "unknown")
-                        tool_args = tool_call.get("args", {})
-                        tool_calls.append((tool_name, tool_args))
-                        print(f"{Fore.YELLOW}🔧 Calling tool: {Fore.GREEN}{tool_name}{Style.RESET_ALL}")
-                        print(f"{Fore.YELLOW}   Args: {Fore.WHITE}{tool_args}{Style.RESET_ALL}\n")
-                
-                # Track tool responses
-                elif hasattr(msg, "content") and hasattr(msg, "name"):
-                    # This is a tool message
-                    content = str(msg.content)
-                    if len(content) > 300:
-                        content = content[:300] + "..."
-                    print(f"{Fore.YELLOW}✅ Tool result: {Fore.WHITE}{content}{Style.RESET_ALL}\n")
-                
-                # Track final assistant message
-                elif hasattr(msg, "content") and msg.__class__.__name__ == "AIMessage":
-                    if not hasattr(msg, "tool_calls") or not msg.tool_calls:
-                        final_response = msg.content
+            for msg in update.get("messages", []):
+                handler = _MESSAGE_HANDLERS.get(type(msg))
+                if handler is not None:
+                    answer = handler(msg, buf, tool_calls)
+                    if answer is not None:
+                        final_response = answer
+        
+        # One write per chunk
+        if buf:
+            sys.stdout.write("".join(buf))
+            sys.stdout.flush()
     
-    print(f"{Fore.CYAN}{'='*60}{Style.RESET_ALL}")
+    print(_RULE)
     print(f"{Fore.CYAN}Final Answer:{Style.RESET_ALL}\n")
     if final_response:
-        print(f"{Fore.WHITE}{final_response}{Style.RESET_ALL}\n")
+        print(_FINAL_ANSWER_TMPL.format(answer=final_response))
     
     if tool_calls:
-        print(f"{Fore.MAGENTA}📊 Tools used: {', '.join([t[0] for t in tool_calls])}{Style.RESET_ALL}\n")
+        print(_TOOLS_USED_TMPL.format(names=", ".join(t[0] for t in tool_calls)))
 
 # --------------------------
 # Main
 # --------------------------
+async def ainput(prompt: str = "") -> str:
+    """input() run in the default executor so the event loop keeps running"""
+    return await asyncio.get_running_loop().run_in_executor(None, input, prompt)
+
+def create_llm_http_client() -> httpx.AsyncClient:
+    """Shared pooled client for LLM API calls (HTTP/2 when h2 is installed)"""
+    return httpx.AsyncClient(
+        http2=HTTP2_AVAILABLE,
+        timeout=60,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+    )
+
 async def main():
-    async with streamablehttp_client(SERVER_URL) as (read, write, _):
+    async with create_llm_http_client() as llm_http_client, \
+            streamablehttp_client(SERVER_URL) as (read, write, _):
         async with ClientSession(read, write) as session:
             await session.initialize()
 
             print(f"{Fore.CYAN}Initializing MCP Agent...{Style.RESET_ALL}")
 
-            # Load MCP tools
-            mcp_tools = await load_mcp_tools(session)
+            # Load MCP tools, warm the resource listing cache and load the system prompt concurrently
+            print(f"{Fore.CYAN}📚 Loading tools, resources and prompt...{Style.RESET_ALL}")
+            mcp_tools, _, base_system_prompt = await asyncio.gather(
+                load_mcp_tools(session),
+                get_available_resources(session),
+                load_system_prompt(session),
+            )
             print(f"{Fore.GREEN}✅ Loaded {len(mcp_tools)} MCP tools{Style.RESET_ALL}")
-
-            # PRE-LOAD all available resources
-            print(f"{Fore.CYAN}📚 Loading available resources...{Style.RESET_ALL}")
-            available_resources_text = await get_available_resources(session)
             print(f"{Fore.GREEN}✅ Resources loaded{Style.RESET_ALL}\n")
 
-            # Load system prompt
-            try:
-                mcp_prompts = await load_mcp_prompt(session, "system_prompt")
-                base_system_prompt = mcp_prompts[0].content if mcp_prompts else "You are a helpful assistant."
-            except:
-                base_system_prompt = "You are a helpful assistant."
-
-            # Build system prompt WITH pre-loaded resources
-            system_prompt = f"""{base_system_prompt}
-
-{available_resources_text}
-
-INSTRUCTIONS:
-- The resources listed above are available for you to fetch
-- To access a resource's content, use the 'fetch_mcp_resource' tool with the exact URI shown above
-- You do NOT need to list resources first - they are already shown above
-- Simply use fetch_mcp_resource when you need the content of any listed resource
-
-Example:
-User: "Show me the schema for users table"
-You: Use fetch_mcp_resource with uri="schema://table/users"
-"""
+            # Resources are discovered on demand instead of being inlined every turn
+            system_prompt = (
+                f"{base_system_prompt}\n\n"
+                "Call 'list_resources' to see available URIs, then 'fetch_mcp_resource' "
+                "(with all the URIs you need in one call)."
+            )
 
             # Prompt template
             prompt_template = ChatPromptTemplate.from_messages([
@@ -186,18 +276,19 @@ You: Use fetch_mcp_resource with uri="schema://table/users"
                 MessagesPlaceholder("messages")
             ])
 
-            # Create fetch tool
-            fetch_tool = await create_fetch_tool(session)
-            all_tools = mcp_tools + [fetch_tool]
+            # Create resource tools
+            resource_tools = [create_list_tool(session), await create_fetch_tool(session)]
+            all_tools = mcp_tools + resource_tools
 
-            print(f"{Fore.GREEN}✅ Total tools: {len(all_tools)} (MCP: {len(mcp_tools)}, Resource: 1){Style.RESET_ALL}")
+            print(f"{Fore.GREEN}✅ Total tools: {len(all_tools)} (MCP: {len(mcp_tools)}, Resource: {len(resource_tools)}){Style.RESET_ALL}")
 
             # LLM
             llm = ChatOpenAI(
                 model="x-ai/grok-4-fast:free",
                 temperature=0,
                 api_key=os.getenv("OPENROUTER_API_KEY"),
-                base_url="https://openrouter.ai/api/v1"
+                base_url="https://openrouter.ai/api/v1",
+                http_async_client=llm_http_client
             )
 
             # Create agent
@@ -219,7 +310,7 @@ You: Use fetch_mcp_resource with uri="schema://table/users"
             print(f"  - What is Ali's age?\n")
 
             while True:
-                user_input = input(f"{Fore.GREEN}You: {Style.RESET_ALL}")
+                user_input = await ainput(f"{Fore.GREEN}You: {Style.RESET_ALL}")
                 
                 if user_input.lower() in {"quit", "exit", "q"}:
                     print(f"\n{Fore.MAGENTA}Goodbye! 👋{Style.RESET_ALL}\n")
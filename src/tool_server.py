@@ -4,10 +4,15 @@
 - API Docs: http://localhost:8000/docs
 """
 
+import asyncio
+import re
+import time
+from dataclasses import asdict, dataclass
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import Any
 from pathlib import Path
 from unified_server import create_server, tool, resource, prompt
+from unified_server.utils import dumps
 
 
 # ============================================================================
@@ -27,7 +32,7 @@ def multiply(x: float, y: float) -> float:
 
 
 @tool(description="Search for information")
-def search(query: str, max_results: int = 5) -> Dict[str, Any]:
+def search(query: str, max_results: int = 5) -> dict[str, Any]:
     """Search for information (mock)"""
     return {
         "query": query,
@@ -36,15 +41,18 @@ def search(query: str, max_results: int = 5) -> Dict[str, Any]:
     }
 
 
+POSITIVE_WORDS = frozenset({"good", "great", "excellent", "happy", "love"})
+NEGATIVE_WORDS = frozenset({"bad", "terrible", "sad", "hate", "awful"})
+_WORD_RE = re.compile(r"[a-z]+")
+
+
 @tool(description="Analyze text sentiment")
-def analyze_sentiment(text: str) -> Dict[str, Any]:
+def analyze_sentiment(text: str) -> dict[str, Any]:
     """Analyze text sentiment"""
-    positive_words = ["good", "great", "excellent", "happy", "love"]
-    negative_words = ["bad", "terrible", "sad", "hate", "awful"]
-    
-    text_lower = text.lower()
-    pos_count = sum(1 for word in positive_words if word in text_lower)
-    neg_count = sum(1 for word in negative_words if word in text_lower)
+    # Count distinct sentiment words among the text's tokens
+    tokens = set(_WORD_RE.findall(text.lower()))
+    pos_count = len(tokens & POSITIVE_WORDS)
+    neg_count = len(tokens & NEGATIVE_WORDS)
     
     if pos_count > neg_count:
         sentiment = "positive"
@@ -60,13 +68,93 @@ def analyze_sentiment(text: str) -> Dict[str, Any]:
     }
 
 import os
-import json
 try:
     from dotenv import load_dotenv
     load_dotenv()
 except ImportError:
     pass
 
+# Connection pools keyed by (db_type, db_name), created on first use
+_pools: dict[tuple[str, str], Any] = {}
+_pools_lock = asyncio.Lock()
+
+# Table lists keyed by (db_type, db_name) -> (fetched_at, tables)
+TABLES_CACHE_TTL = 30.0
+_tables_cache: dict[tuple[str, str], tuple[float, list[str]]] = {}
+
+
+@dataclass(frozen=True)
+class _DBConf:
+    """Connection settings for one database type, read once at import"""
+    host: str
+    port: int
+    user: str
+    password: str
+
+
+_DB_CONF = {
+    "postgres": _DBConf(
+        host=os.getenv("POSTGRES_HOST", "localhost"),
+        port=int(os.getenv("POSTGRES_PORT", "5432")),
+        user=os.getenv("POSTGRES_USER", "postgres"),
+        password=os.getenv("POSTGRES_PASSWORD", ""),
+    ),
+    "mysql": _DBConf(
+        host=os.getenv("MYSQL_HOST", "localhost"),
+        port=int(os.getenv("MYSQL_PORT", "3306")),
+        user=os.getenv("MYSQL_USER", "root"),
+        password=os.getenv("MYSQL_PASSWORD", ""),
+    ),
+}
+
+
+async def _get_pool(db_type: str, db_name: str) -> Any:
+    """Return the pool for (db_type, db_name), creating it on first use"""
+    key = (db_type, db_name)
+    pool = _pools.get(key)
+    if pool is not None:
+        return pool
+    
+    async with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            credentials = asdict(_DB_CONF[db_type])
+            if db_type == "mysql":
+                import aiomysql
+                pool = await aiomysql.create_pool(
+                    minsize=1, maxsize=10, db=db_name, **credentials
+                )
+            else:  # postgres
+                import asyncpg
+                pool = await asyncpg.create_pool(
+                    min_size=1, max_size=10, database=db_name, **credentials
+                )
+            _pools[key] = pool
+    return pool
+
+
+async def close_pools() -> None:
+    """Close all database pools (registered as a server shutdown hook)"""
+    pools = list(_pools.items())
+    _pools.clear()
+    for (db_type, _), pool in pools:
+        if db_type == "mysql":
+            pool.close()
+            await pool.wait_closed()
+        else:
+            await pool.close()
+
+
+def _format_tables(db_type: str, db_name: str, table_list: list[str]) -> str:
+    result = {
+        "database_type": db_type,
+        "database_name": db_name,
+        "tables": table_list,
+        "table_count": len(table_list)
+    }
+    return dumps(result).decode()
+
+
 @tool(description="Returns a list of tables in a database")
 async def list_tables(db_type: str, db_name: str) -> str:
     """
@@ -82,50 +170,23 @@ async def list_tables(db_type: str, db_name: str) -> str:
     db_type = db_type.lower()
     
     if db_type not in ["mysql", "postgres"]:
-        return json.dumps({"error": "db_type must be 'mysql' or 'postgres'"})
+        return dumps({"error": "db_type must be 'mysql' or 'postgres'"}).decode()
     
-    # Get credentials from environment based on db_type
-    if db_type == "postgres":
-        host = os.getenv("POSTGRES_HOST", "localhost")
-        port = int(os.getenv("POSTGRES_PORT", "5432"))
-        user = os.getenv("POSTGRES_USER", "postgres")
-        password = os.getenv("POSTGRES_PASSWORD", "")
-    else:  # mysql
-        host = os.getenv("MYSQL_HOST", "localhost")
-        port = int(os.getenv("MYSQL_PORT", "3306"))
-        user = os.getenv("MYSQL_USER", "root")
-        password = os.getenv("MYSQL_PASSWORD", "")
+    cached = _tables_cache.get((db_type, db_name))
+    if cached is not None and time.monotonic() - cached[0] < TABLES_CACHE_TTL:
+        return _format_tables(db_type, db_name, cached[1])
     
     try:
+        pool = await _get_pool(db_type, db_name)
+        
         if db_type == "mysql":
-            import aiomysql
-            
-            conn = await aiomysql.connect(
-                host=host,
-                port=port,
-                user=user,
-                password=password,
-                db=db_name
-            )
-            
-            async with conn.cursor() as cursor:
-                await cursor.execute("SHOW TABLES")
-                tables = await cursor.fetchall()
-                table_list = [table[0] for table in tables]
-            
-            conn.close()
+            async with pool.acquire() as conn:
+                async with conn.cursor() as cursor:
+                    await cursor.execute("SHOW TABLES")
+                    tables = await cursor.fetchall()
+                    table_list = [table[0] for table in tables]
             
         else:  # postgres
-            import asyncpg
-            
-            conn = await asyncpg.connect(
-                host=host,
-                port=port,
-                user=user,
-                password=password,
-                database=db_name
-            )
-            
             query = """
                 SELECT tablename 
                 FROM pg_tables 
@@ -133,26 +194,19 @@ async def list_tables(db_type: str, db_name: str) -> str:
                 ORDER BY tablename
             """
             
-            rows = await conn.fetch(query)
-            table_list = [row['tablename'] for row in rows]
-            
-            await conn.close()
-        
-        result = {
-            "database_type": db_type,
-            "database_name": db_name,
-            "tables": table_list,
-            "table_count": len(table_list)
-        }
+            async with pool.acquire() as conn:
+                rows = await conn.fetch(query)
+                table_list = [row['tablename'] for row in rows]
         
-        return json.dumps(result, indent=2)
+        _tables_cache[(db_type, db_name)] = (time.monotonic(), table_list)
+        return _format_tables(db_type, db_name, table_list)
         
     except Exception as e:
-        return json.dumps({
+        return dumps({
             "error": f"Failed to connect to {db_type} database: {str(e)}",
             "database_type": db_type,
             "database_name": db_name
-        })
+        }).decode()
 
 # ============================================================================
 #  RESOURCES
@@ -163,7 +217,7 @@ async def list_tables(db_type: str, db_name: str) -> str:
     description="Application configuration",
     mime_type="application/json"
 )
-def get_config() -> Dict[str, Any]:
+def get_config() -> dict[str, Any]:
     """Return app config"""
     return {
         "app_name": "Multi-Agent System",
@@ -177,7 +231,7 @@ def get_config() -> Dict[str, Any]:
     description="List of agents",
     mime_type="application/json"
 )
-def get_agents() -> List[Dict[str, str]]:
+def get_agents() -> list[dict[str, str]]:
     """Return list of agents"""
     return [
         {"id": "agent-1", "name": "Researcher", "status": "active"},
@@ -345,6 +399,10 @@ Context Notes:
 """
 
 
+# File contents keyed by path -> (st_mtime_ns, text)
+_file_cache: dict[str, tuple[int, str]] = {}
+
+
 # You can also load from actual files:
 @resource(
     uri="file://local/data.txt",
@@ -359,7 +417,16 @@ def get_file_content() -> str:
     if not file_path.exists():
         file_path.write_text("This is sample data from a real file.\nYou can edit data.txt to change this content.")
     
-    return file_path.read_text()
+    # Re-read only when the file has changed since the last call
+    mtime = file_path.stat().st_mtime_ns
+    key = str(file_path)
+    cached = _file_cache.get(key)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    
+    data = file_path.read_text()
+    _file_cache[key] = (mtime, data)
+    return data
 
 
 # ============================================================================
@@ -370,7 +437,7 @@ def get_file_content() -> str:
     description="System prompt for AI assistant",
     arguments=[]
 )
-def system_prompt() -> List[Dict[str, Any]]:
+def system_prompt() -> list[dict[str, Any]]:
     """Generate system prompt for AI assistant"""
     return [
         {
@@ -389,7 +456,7 @@ def system_prompt() -> List[Dict[str, Any]]:
         {"name": "language", "description": "Programming language", "required": True}
     ]
 )
-def code_review(language: str) -> List[Dict[str, Any]]:
+def code_review(language: str) -> list[dict[str, Any]]:
     """Generate code review prompt"""
     return [
         {
@@ -406,4 +473,5 @@ def code_review(language: str) -> List[Dict[str, Any]]:
 
 if __name__ == "__main__":
     server = create_server(name="my-agent-server", version="1.0.0")
+    server.app.router.on_shutdown.append(close_pools)
     server.run(host="0.0.0.0", port=8002)
\ No newline at end of file
@@ -14,8 +14,10 @@ class ServerConfig:
     host: str = "0.0.0.0"
     port: int = 8000
     log_level: str = "INFO"
+    # uvicorn event loop: "auto" picks uvloop when installed (uvicorn[standard])
+    loop: str = "auto"
     
-    # CORS settings
+    # CORS settings (disabled: no middleware is installed; preferred behind a proxy)
     cors_enabled: bool = False
     cors_origins: list[str] | None = None
     
@@ -45,6 +47,7 @@ class ServerConfig:
             host=os.getenv("SERVER_HOST", "0.0.0.0"),
             port=port,
             log_level=os.getenv("LOG_LEVEL", "INFO"),
+            loop=os.getenv("SERVER_LOOP", "auto"),
         )
 
 
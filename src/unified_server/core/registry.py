@@ -2,72 +2,393 @@
 Central registry for tools, resources, and prompts.
 """
 
+import functools
+import inspect
+import re
+import sys
+from types import MappingProxyType
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict
+from collections.abc import Awaitable, Callable
+from re import Pattern
+from typing import Any
 
+try:
+    import re2  # type: ignore[import-not-found]
+except ImportError:  # google-re2 is optional; stdlib re handles template matching
+    re2 = None
 
-@dataclass
+from starlette.concurrency import run_in_threadpool
+
+from ..utils.inspection import is_async_function
+from ..utils.logging import get_logger
+from ..utils.serialization import dumps
+
+
+logger = get_logger("core.registry")
+
+_TEMPLATE_PARAM_RE = re.compile(r"\{([^}]+)\}")
+
+
+class _KeepMissing(dict):
+    """format_map mapping that leaves unknown placeholders in place"""
+    __slots__ = ()
+    
+    def __missing__(self, key: str) -> str:
+        return "{" + key + "}"
+
+
+@functools.cache
+def _compile_template(
+    uri_template: str
+) -> tuple[tuple[str | int, ...], tuple[str, ...], Pattern, str | None]:
+    """
+    Parse a URI template once into render segments and a reverse-match regex
+    
+    Returns:
+        (segments, param_names, pattern, format_template) where segments are
+        literal strings or indexes into param_names, pattern matches concrete
+        URIs, and format_template is a str.format_map equivalent (None when a
+        parameter name is not an identifier)
+    """
+    segments: list[str | int] = []
+    names: list[str] = []
+    pattern = ["^"]
+    pos = 0
+    for match in _TEMPLATE_PARAM_RE.finditer(uri_template):
+        literal = uri_template[pos:match.start()]
+        if literal:
+            segments.append(literal)
+            pattern.append(re.escape(literal))
+        segments.append(len(names))
+        names.append(match.group(1))
+        pattern.append("([^/]+)")
+        pos = match.end()
+    
+    literal = uri_template[pos:]
+    if literal:
+        segments.append(literal)
+        pattern.append(re.escape(literal))
+    pattern.append("$")
+    
+    format_template = None
+    if all(name.isidentifier() for name in names):
+        format_template = "".join(
+            seg.replace("{", "{{").replace("}", "}}") if isinstance(seg, str)
+            else "{" + names[seg] + "}"
+            for seg in segments
+        )
+    
+    return tuple(segments), tuple(names), _compile_uri_pattern("".join(pattern)), format_template
+
+
+def _compile_uri_pattern(pattern: str) -> Pattern:
+    """
+    Compile a template match pattern, preferring linear-time re2
+    
+    Template parameters always match "[^/]+" and literals are re.escape()d,
+    so the pattern is valid for both engines.
+    """
+    if re2 is not None:
+        try:
+            return re2.compile(pattern)
+        except re2.error:
+            pass
+    return re.compile(pattern)
+
+
+def _positional_params(func: Callable) -> tuple[str, ...] | None:
+    """Parameter names of func if all of them are plain positional-or-keyword"""
+    # Not get_signature(): that follows __wrapped__, and a functools.wraps
+    # wrapper taking (*args, **kwargs) must be judged by its own signature
+    try:
+        params = inspect.signature(func, follow_wrapped=False).parameters.values()
+    except (TypeError, ValueError):
+        return None
+    if any(p.kind is not inspect.Parameter.POSITIONAL_OR_KEYWORD for p in params):
+        return None
+    return tuple(p.name for p in params)
+
+
+def _as_async(func: Callable, is_async: bool) -> Callable[..., Awaitable[Any]]:
+    """Awaitable adapter for func: itself if async, else a threadpool call"""
+    if is_async:
+        return func
+    return functools.partial(run_in_threadpool, func)
+
+
+@dataclass(slots=True, frozen=True)
 class ToolInfo:
     """Information about a registered tool"""
     function: Callable
     description: str
-    parameters: Dict[str, Any]
+    parameters: dict[str, Any]
+    # Compiled argument validator (explicit schemas only)
+    validator: Callable[[Any], None] | None = field(default=None, repr=False, compare=False)
+    # JSON encoding of parameters, computed once at registration
+    parameters_json: bytes = field(init=False, repr=False, compare=False)
+    is_async: bool = field(init=False, repr=False, compare=False)
+    # Always awaitable; sync tools are dispatched to the threadpool
+    async_function: Callable[..., Awaitable[Any]] = field(init=False, repr=False, compare=False)
+    # Ordered parameter names when every parameter can be passed positionally
+    positional_params: tuple[str, ...] | None = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        # Frozen: set derived fields through object.__setattr__
+        object.__setattr__(self, "parameters_json", dumps(self.parameters))
+        object.__setattr__(self, "is_async", is_async_function(self.function))
+        object.__setattr__(self, "async_function", _as_async(self.function, self.is_async))
+        object.__setattr__(self, "positional_params", _positional_params(self.function))
+    
+    def call(self, arguments: dict[str, Any]) -> Any:
+        """Invoke the tool function (returns a coroutine for async tools)"""
+        return self._invoke(self.function, arguments)
+    
+    def call_async(self, arguments: dict[str, Any]) -> Awaitable[Any]:
+        """Invoke the tool without blocking the event loop; always awaitable"""
+        return self._invoke(self.async_function, arguments)
+    
+    def _invoke(self, function: Callable, arguments: dict[str, Any]) -> Any:
+        names = self.positional_params
+        if names is not None and len(arguments) == len(names):
+            try:
+                args = tuple([arguments[name] for name in names])
+            except KeyError:
+                pass
+            else:
+                return function(*args)
+        return function(**arguments)
+    
+    def validate_arguments(self, arguments: dict[str, Any]) -> None:
+        """Validate arguments against the tool schema (raises ValueError)"""
+        if self.validator is not None:
+            self.validator(arguments)
 
 
-@dataclass
+def _render_template(uri_template: str, params: dict[str, Any]) -> str:
+    """Substitute params into a URI template, leaving unknown placeholders"""
+    segments, names, _, format_template = _compile_template(uri_template)
+    if format_template is not None:
+        return format_template.format_map(_KeepMissing(params))
+    
+    return "".join(
+        segment if isinstance(segment, str)
+        else params.get(names[segment], "{" + names[segment] + "}")
+        for segment in segments
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _resolve_cached(uri_template: str, items: tuple[tuple[str, Any], ...]) -> str:
+    """Memoized _render_template keyed by the sorted parameter items"""
+    return _render_template(uri_template, dict(items))
+
+
+@functools.lru_cache(maxsize=1024)
+def _match_cached(uri_template: str, uri: str) -> tuple[str, ...] | None:
+    """Memoized reverse match of a concrete URI against a template"""
+    match = _compile_template(uri_template)[2].match(uri)
+    return None if match is None else match.groups()
+
+
+@dataclass(slots=True, frozen=True)
 class ResourceInfo:
     """Information about a registered resource"""
     function: Callable
     uri: str
     description: str
     mime_type: str
+    is_async: bool = field(init=False, repr=False, compare=False)
+    # Always awaitable; sync functions are dispatched to the threadpool
+    async_function: Callable[..., Awaitable[Any]] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "is_async", is_async_function(self.function))
+        object.__setattr__(self, "async_function", _as_async(self.function, self.is_async))
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ResourceTemplateInfo:
     """Information about a registered resource template"""
     function: Callable
     uri_template: str  # e.g., "file://user/{user_id}/profile"
     description: str
     mime_type: str
-    parameters: list[Dict[str, str]]  # Parameter definitions
+    parameters: list[dict[str, str]]  # Parameter definitions
+    # Placeholder names of uri_template, in order
+    _param_names: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    is_async: bool = field(init=False, repr=False, compare=False)
+    # Always awaitable; sync functions are dispatched to the threadpool
+    async_function: Callable[..., Awaitable[Any]] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "is_async", is_async_function(self.function))
+        object.__setattr__(self, "async_function", _as_async(self.function, self.is_async))
+        object.__setattr__(self, "_param_names", _compile_template(self.uri_template)[1])
     
-    def resolve_uri(self, params: Dict[str, str]) -> str:
-        """Resolve template URI with parameters"""
-        uri = self.uri_template
-        for key, value in params.items():
-            uri = uri.replace(f"{{{key}}}", value)
-        return uri
+    def resolve_uri(self, params: dict[str, str]) -> str:
+        """Resolve template URI with parameters (missing ones are left as placeholders)"""
+        try:
+            return _resolve_cached(self.uri_template, tuple(sorted(params.items())))
+        except TypeError:
+            # Unhashable parameter values: render without the cache
+            return _render_template(self.uri_template, params)
+    
+    def format_uri(self, params: dict[str, Any]) -> str:
+        """Resolve template URI strictly (raises KeyError for a missing parameter)"""
+        segments, names = _compile_template(self.uri_template)[:2]
+        return "".join([
+            segment if isinstance(segment, str) else str(params[names[segment]])
+            for segment in segments
+        ])
+    
+    def match_uri(self, uri: str) -> dict[str, str] | None:
+        """Extract parameters from a concrete URI, or None if it doesn't match"""
+        groups = _match_cached(self.uri_template, uri)
+        if groups is None:
+            return None
+        return dict(zip(self._param_names, groups))
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PromptInfo:
     """Information about a registered prompt"""
     function: Callable
     description: str
-    arguments: list[Dict[str, str]]
+    arguments: list[dict[str, str]]
+    is_async: bool = field(init=False, repr=False, compare=False)
+    # Always awaitable; sync functions are dispatched to the threadpool
+    async_function: Callable[..., Awaitable[Any]] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "is_async", is_async_function(self.function))
+        object.__setattr__(self, "async_function", _as_async(self.function, self.is_async))
+
+
+# Trie keys: wildcard segment and leaf marker (never valid URI segments)
+_WILDCARD = object()
+_LEAF = object()
+
+
+def _build_template_trie(
+    templates: dict[str, "ResourceTemplateInfo"]
+) -> tuple[dict[Any, Any], list["ResourceTemplateInfo"]]:
+    """
+    Index templates by "/"-separated segments
+    
+    Returns:
+        (trie, fallback) - templates with placeholders inside a segment
+        (e.g. "item-{id}.json") go to fallback and are matched by regex
+    """
+    trie: dict[Any, Any] = {}
+    fallback = []
+    for info in templates.values():
+        segments = info.uri_template.split("/")
+        if any(
+            "{" in seg and not _TEMPLATE_PARAM_RE.fullmatch(seg) for seg in segments
+        ):
+            fallback.append(info)
+            continue
+        
+        node = trie
+        for seg in segments:
+            node = node.setdefault(_WILDCARD if seg.startswith("{") else seg, {})
+        node[_LEAF] = info
+    return trie, fallback
+
+
+def _walk_template_trie(node: dict[Any, Any], segments: list[str], i: int):
+    """Depth-first walk preferring exact segments over wildcards"""
+    if i == len(segments):
+        return node.get(_LEAF)
+    child = node.get(segments[i])
+    if child is not None:
+        found = _walk_template_trie(child, segments, i + 1)
+        if found is not None:
+            return found
+    child = node.get(_WILDCARD)
+    if child is not None and segments[i]:
+        return _walk_template_trie(child, segments, i + 1)
+    return None
 
 
 @dataclass
 class UnifiedRegistry:
     """Central registry for tools, resources, and prompts"""
-    tools: Dict[str, ToolInfo] = field(default_factory=dict)
-    resources: Dict[str, ResourceInfo] = field(default_factory=dict)
-    resource_templates: Dict[str, ResourceTemplateInfo] = field(default_factory=dict)
-    prompts: Dict[str, PromptInfo] = field(default_factory=dict)
+    tools: dict[str, ToolInfo] = field(default_factory=dict)
+    resources: dict[str, ResourceInfo] = field(default_factory=dict)
+    resource_templates: dict[str, ResourceTemplateInfo] = field(default_factory=dict)
+    prompts: dict[str, PromptInfo] = field(default_factory=dict)
+    # Index of resources by URI, kept in sync with resources
+    resources_by_uri: dict[str, ResourceInfo] = field(default_factory=dict)
+    # Values derived from the registrations (e.g. serialized listings)
+    _cache: dict[Any, Any] = field(default_factory=dict, repr=False, compare=False)
+    _frozen: bool = field(default=False, repr=False, compare=False)
+    
+    @property
+    def frozen(self) -> bool:
+        """True once freeze() has been called (until clear())"""
+        return self._frozen
+    
+    def freeze(self) -> None:
+        """
+        Make the registry read-only
+        
+        The registration maps are swapped for read-only views and further
+        register_* calls raise RuntimeError, so cached derived values stay
+        valid for the rest of the process. clear() unfreezes.
+        """
+        if self._frozen:
+            return
+        # Typed as dict for the (usual) mutable case; views are read-only Mappings
+        self.tools = MappingProxyType(self.tools)  # type: ignore[assignment]
+        self.resources = MappingProxyType(self.resources)  # type: ignore[assignment]
+        self.resource_templates = MappingProxyType(  # type: ignore[assignment]
+            self.resource_templates
+        )
+        self.prompts = MappingProxyType(self.prompts)  # type: ignore[assignment]
+        self.resources_by_uri = MappingProxyType(  # type: ignore[assignment]
+            self.resources_by_uri
+        )
+        self._frozen = True
+        # Build registry-owned derived state up front
+        self.cached("template_trie", lambda: _build_template_trie(self.resource_templates))
+    
+    def _check_mutable(self) -> None:
+        if self._frozen:
+            raise RuntimeError("Registry is frozen; register everything before freeze()")
+    
+    def cached(self, key: Any, factory: Callable[[], Any]) -> Any:
+        """
+        Return the value cached under key, computing it with factory on a miss.
+        
+        The cache is dropped whenever anything is registered or cleared.
+        """
+        try:
+            return self._cache[key]
+        except KeyError:
+            value = self._cache[key] = factory()
+            return value
+    
+    def _invalidate(self) -> None:
+        self._cache.clear()
     
     def register_tool(
         self,
         name: str,
         function: Callable,
         description: str,
-        parameters: Dict[str, Any]
+        parameters: dict[str, Any],
+        validator: Callable[[Any], None] | None = None
     ) -> None:
         """Register a new tool"""
+        self._check_mutable()
+        self._invalidate()
+        name = sys.intern(name)
         self.tools[name] = ToolInfo(
             function=function,
             description=description,
-            parameters=parameters
+            parameters=parameters,
+            validator=validator
         )
     
     def register_resource(
@@ -79,12 +400,26 @@ class UnifiedRegistry:
         mime_type: str
     ) -> None:
         """Register a new resource"""
-        self.resources[name] = ResourceInfo(
+        self._check_mutable()
+        self._invalidate()
+        name, uri, mime_type = sys.intern(name), sys.intern(uri), sys.intern(mime_type)
+        
+        # Drop the old URI if this name is being re-registered elsewhere
+        previous = self.resources.get(name)
+        if previous is not None and self.resources_by_uri.get(previous.uri) is previous:
+            del self.resources_by_uri[previous.uri]
+        
+        existing = self.resources_by_uri.get(uri)
+        if existing is not None and existing is not previous:
+            logger.warning("Resource URI %.100s is already registered; replacing it", uri)
+        
+        info = self.resources[name] = ResourceInfo(
             function=function,
             uri=uri,
             description=description,
             mime_type=mime_type
         )
+        self.resources_by_uri[uri] = info
     
     def register_resource_template(
         self,
@@ -93,9 +428,14 @@ class UnifiedRegistry:
         uri_template: str,
         description: str,
         mime_type: str,
-        parameters: list[Dict[str, str]]
+        parameters: list[dict[str, str]]
     ) -> None:
         """Register a new resource template"""
+        self._check_mutable()
+        self._invalidate()
+        name, uri_template, mime_type = (
+            sys.intern(name), sys.intern(uri_template), sys.intern(mime_type)
+        )
         self.resource_templates[name] = ResourceTemplateInfo(
             function=function,
             uri_template=uri_template,
@@ -108,6 +448,28 @@ class UnifiedRegistry:
         """Get a resource template by name"""
         return self.resource_templates.get(name)
     
+    def match_resource_template(
+        self, uri: str
+    ) -> tuple[ResourceTemplateInfo, dict[str, str]] | None:
+        """
+        Find the resource template matching a concrete URI
+        
+        Returns:
+            (template, parameters) or None if no template matches
+        """
+        trie, fallback = self.cached(
+            "template_trie", lambda: _build_template_trie(self.resource_templates)
+        )
+        info = _walk_template_trie(trie, uri.split("/"), 0)
+        if info is not None:
+            return info, info.match_uri(uri)
+        
+        for info in fallback:
+            params = info.match_uri(uri)
+            if params is not None:
+                return info, params
+        return None
+    
     def list_resource_template_names(self) -> list[str]:
         """List all resource template names"""
         return list(self.resource_templates.keys())
@@ -117,9 +479,12 @@ class UnifiedRegistry:
         name: str,
         function: Callable,
         description: str,
-        arguments: list[Dict[str, str]]
+        arguments: list[dict[str, str]]
     ) -> None:
         """Register a new prompt"""
+        self._check_mutable()
+        self._invalidate()
+        name = sys.intern(name)
         self.prompts[name] = PromptInfo(
             function=function,
             description=description,
@@ -136,10 +501,7 @@ class UnifiedRegistry:
     
     def get_resource_by_uri(self, uri: str) -> ResourceInfo | None:
         """Get a resource by URI"""
-        for resource in self.resources.values():
-            if resource.uri == uri:
-                return resource
-        return None
+        return self.resources_by_uri.get(uri)
     
     def get_prompt(self, name: str) -> PromptInfo | None:
         """Get a prompt by name"""
@@ -158,11 +520,13 @@ class UnifiedRegistry:
         return list(self.prompts.keys())
     
     def clear(self) -> None:
-        """Clear all registrations"""
-        self.tools.clear()
-        self.resources.clear()
-        self.resource_templates.clear()
-        self.prompts.clear()
+        """Clear all registrations (and unfreeze)"""
+        self._invalidate()
+        # Fresh maps rather than in-place clear(): one path for frozen
+        # (read-only views) and mutable registries, no per-key deletes
+        self.tools, self.resources, self.resources_by_uri = {}, {}, {}
+        self.resource_templates, self.prompts = {}, {}
+        self._frozen = False
 
 
 # Global registry instance
@@ -2,8 +2,15 @@
 Main unified server implementation.
 """
 
+import copy
+import dataclasses
+import functools
+import sys
+from collections.abc import Hashable
+from typing import Any
+
 import uvicorn
-from fastapi import FastAPI
+from fastapi import APIRouter, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from mcp.server import Server
 
@@ -16,7 +23,50 @@ from ..routes.prompts import create_prompts_router
 from ..routes.mcp import create_mcp_router
 from ..routes.api import create_api_router
 from ..handlers.mcp_handlers import setup_mcp_handlers
-from ..utils.logging import setup_logging, get_logger
+from ..utils.logging import setup_logging
+from ..utils.serialization import ORJSONResponse
+
+
+@functools.lru_cache(maxsize=1)
+def _shared_routers() -> tuple[APIRouter, ...]:
+    """Config-independent routers, built once per process"""
+    return (
+        create_api_router(),
+        # Individual routes (legacy, can be removed if not needed)
+        create_tools_router(),
+        create_resources_router(),
+        create_prompts_router(),
+    )
+
+
+def _freeze(value: Any) -> Hashable:
+    """Hashable equivalent of a config value (lists and dicts become tuples)"""
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    return value
+
+
+# Base and MCP routers per configuration, keyed by a frozen field snapshot
+_CONFIG_ROUTERS_MAX = 8
+_config_routers_cache: dict[Hashable, tuple[APIRouter, APIRouter]] = {}
+
+
+def _config_routers(config: ServerConfig) -> tuple[APIRouter, APIRouter]:
+    """Base and MCP routers for one configuration"""
+    key = tuple(
+        (f.name, _freeze(getattr(config, f.name))) for f in dataclasses.fields(config)
+    )
+    routers = _config_routers_cache.get(key)
+    if routers is None:
+        if len(_config_routers_cache) >= _CONFIG_ROUTERS_MAX:
+            del _config_routers_cache[next(iter(_config_routers_cache))]
+        # Routers read the config per request: give them a private copy
+        config = copy.deepcopy(config)
+        routers = (create_base_router(config), create_mcp_router(config))
+        _config_routers_cache[key] = routers
+    return routers
 
 
 class UnifiedServer:
@@ -36,11 +86,11 @@ class UnifiedServer:
             version: Server version
             config: Server configuration (optional)
         """
+        # One path for both cases; a provided config is copied, not mutated
         if config is None:
             config = ServerConfig(name=name, version=version)
         else:
-            config.name = name
-            config.version = version
+            config = dataclasses.replace(config, name=name, version=version)
         
         self.config = config
         self.logger = setup_logging(config.log_level)
@@ -60,7 +110,8 @@ class UnifiedServer:
             version=self.config.version,
             docs_url=self.config.docs_url,
             redoc_url=self.config.redoc_url,
-            openapi_url=self.config.openapi_url
+            openapi_url=self.config.openapi_url,
+            default_response_class=ORJSONResponse
         )
         
         # Add CORS middleware if enabled
@@ -76,22 +127,17 @@ class UnifiedServer:
         return app
     
     def _setup_routes(self) -> None:
-        """Setup all routes"""
+        """Setup all routes (router objects are shared between instances)"""
+        base_router, mcp_router = _config_routers(self.config)
+        
         # Base routes
-        base_router = create_base_router(self.config)
         self.app.include_router(base_router)
         
-        # REST API (new unified API)
-        api_router = create_api_router()
-        self.app.include_router(api_router)
-        
-        # Individual routes (legacy, can be removed if not needed)
-        self.app.include_router(create_tools_router())
-        self.app.include_router(create_resources_router())
-        self.app.include_router(create_prompts_router())
+        # REST API (new unified API) and legacy individual routes
+        for router in _shared_routers():
+            self.app.include_router(router)
         
         # MCP route
-        mcp_router = create_mcp_router(self.config)
         self.app.include_router(mcp_router)
     
     def run(
@@ -109,10 +155,12 @@ class UnifiedServer:
             port: Port to bind to (defaults to config.port)
             log_level: Logging level (defaults to config.log_level)
             **kwargs: Additional arguments passed to uvicorn.run
+                (loop defaults to config.loop)
         """
         host = host or self.config.host
         port = port or self.config.port
         log_level = (log_level or self.config.log_level).lower()
+        kwargs.setdefault("loop", self.config.loop)
         
         # Print startup information
         self._print_startup_info(host, port)
@@ -128,19 +176,26 @@ class UnifiedServer:
     
     def _print_startup_info(self, host: str, port: int) -> None:
         """Print server startup information"""
-        print(f"\n🚀 Starting Unified Server on http://{host}:{port}")
-        print(f"📦 Server: {self.config.name} v{self.config.version}\n")
-        print(f"🔧 Registered {len(registry.tools)} tools")
-        print(f"📚 Registered {len(registry.resources)} resources")
-        print(f"💬 Registered {len(registry.prompts)} prompts\n")
-        print("🌐 Endpoints:")
-        print(f"   REST API:        http://{host}:{port}/")
-        print(f"   API Docs:        http://{host}:{port}{self.config.docs_url}")
-        print(f"   Health Check:    http://{host}:{port}/health")
-        print(f"   MCP (JSON-RPC):  http://{host}:{port}{self.config.mcp_endpoint}")
-        print(f"\n🔗 For Claude/Amazon Q with mcp-remote:")
-        print(f'   "command": "npx"')
-        print(f'   "args": ["mcp-remote", "http://{host}:{port}{self.config.mcp_endpoint}"]\n')
+        base_url = f"http://{host}:{port}"
+        mcp_url = f"{base_url}{self.config.mcp_endpoint}"
+        lines = [
+            f"\n🚀 Starting Unified Server on {base_url}",
+            f"📦 Server: {self.config.name} v{self.config.version}\n",
+            f"🔧 Registered {len(registry.tools)} tools",
+            f"📚 Registered {len(registry.resources)} resources",
+            f"💬 Registered {len(registry.prompts)} prompts\n",
+            "🌐 Endpoints:",
+            f"   REST API:        {base_url}/",
+            f"   API Docs:        {base_url}{self.config.docs_url}",
+            f"   Health Check:    {base_url}/health",
+            f"   MCP (JSON-RPC):  {mcp_url}",
+            "\n🔗 For Claude/Amazon Q with mcp-remote:",
+            '   "command": "npx"',
+            f'   "args": ["mcp-remote", "{mcp_url}"]\n',
+        ]
+        # One write instead of a print per line
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
 
 
 def create_server(
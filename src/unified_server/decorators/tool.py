@@ -2,10 +2,15 @@
 Tool decorator for registering functions as tools.
 """
 
+import copy
 from typing import Any, Callable, Dict, Optional
 
 from ..core.registry import registry
 from ..utils.inspection import get_parameter_schema, get_function_description
+from ..utils.logging import get_logger
+from ..utils.validation import compile_schema_validator
+
+logger = get_logger("decorators.tool")
 
 
 def tool(
@@ -30,28 +35,33 @@ def tool(
             return a + b
     """
     def decorator(func: Callable) -> Callable:
-        try:
-            tool_name = name or func.__name__
-            tool_description = description or get_function_description(func)
-            
-            # Generate parameter schema if not provided
-            if parameters is None:
+        tool_name = name or func.__name__
+        tool_description = description or get_function_description(func)
+        
+        # Generate parameter schema if not provided. Only explicit schemas
+        # are enforced; generated ones are too coarse to validate against.
+        if parameters is None:
+            try:
                 param_schema = get_parameter_schema(func)
-            else:
-                param_schema = parameters
-            
-            # Register the tool
-            registry.register_tool(
-                name=tool_name,
-                function=func,
-                description=tool_description,
-                parameters=param_schema
-            )
-        except Exception as e:
-            # Log error but don't fail the decorator
-            import logging
-            logger = logging.getLogger("unified_server.decorators.tool")
-            logger.error(f"Failed to register tool {func.__name__}: {str(e)[:100]}")
+            except Exception as e:
+                # Signature introspection failed: register with an open schema
+                logger.error("Failed to build schema for tool %s: %.100s", tool_name, e)
+                param_schema = {"type": "object", "properties": {}}
+            validator = None
+        else:
+            # Private copy: the validator and the encoded schema are built
+            # once from it, so later edits to the caller's dict can't drift
+            param_schema = copy.deepcopy(parameters)
+            validator = compile_schema_validator(param_schema)
+        
+        # Register the tool
+        registry.register_tool(
+            name=tool_name,
+            function=func,
+            description=tool_description,
+            parameters=param_schema,
+            validator=validator
+        )
         
         return func
     
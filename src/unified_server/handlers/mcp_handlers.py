@@ -6,10 +6,12 @@ from typing import Any, Dict, List
 
 from mcp.server import Server
 from mcp.types import Tool, TextContent, Resource
+from pydantic import AnyUrl
 
 from ..core.registry import registry
-from ..utils.inspection import is_async_function
+from ..utils.inspection import collect_result
 from ..utils.logging import get_logger
+from ..utils.serialization import to_text
 
 logger = get_logger("handlers.mcp")
 
@@ -24,15 +26,16 @@ def setup_mcp_handlers(mcp_server: Server) -> None:
     
     @mcp_server.list_tools()
     async def list_tools() -> List[Tool]:
-        """List all available tools"""
-        return [
+        """List all available tools (built once per registry state)"""
+        tools = registry.cached(("mcp_server", "tools"), lambda: [
             Tool(
                 name=name,
                 description=info.description,
                 inputSchema=info.parameters
             )
             for name, info in registry.tools.items()
-        ]
+        ])
+        return list(tools)
     
     @mcp_server.call_tool()
     async def call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
@@ -42,31 +45,31 @@ def setup_mcp_handlers(mcp_server: Server) -> None:
             if not tool_info:
                 raise ValueError(f"Tool '{name}' not found")
             
-            if is_async_function(tool_info.function):
-                result = await tool_info.function(**arguments)
-            else:
-                result = tool_info.function(**arguments)
+            tool_info.validate_arguments(arguments)
             
-            return [TextContent(type="text", text=str(result))]
+            result = await tool_info.call_async(arguments)
+            result = await collect_result(result)
+            
+            return [TextContent(type="text", text=to_text(result))]
         except Exception as e:
-            # Log error and re-raise with sanitized message
-            error_msg = str(e)[:100].replace('\n', '').replace('\r', '')
-            safe_name = name.replace('\n', '').replace('\r', '')[:50] if name else 'unknown'
-            logger.error(f"Tool execution failed for {safe_name}: {error_msg}")
+            # The logger strips control characters from emitted records
+            error_msg = str(e)[:100]
+            logger.error("Tool execution failed for %.50s: %s", name or "unknown", error_msg)
             raise ValueError(f"Tool execution failed: {error_msg}")
     
     @mcp_server.list_resources()
     async def list_resources() -> List[Resource]:
-        """List all available resources"""
-        return [
+        """List all available resources (built once per registry state)"""
+        resources = registry.cached(("mcp_server", "resources"), lambda: [
             Resource(
-                uri=info.uri,
+                uri=AnyUrl(info.uri),
                 name=name,
                 description=info.description,
                 mimeType=info.mime_type
             )
             for name, info in registry.resources.items()
-        ]
+        ])
+        return list(resources)
     
     @mcp_server.read_resource()
     async def read_resource(uri: str) -> str:
@@ -76,14 +79,11 @@ def setup_mcp_handlers(mcp_server: Server) -> None:
             if not resource_info:
                 raise ValueError(f"Resource with URI '{uri}' not found")
             
-            if is_async_function(resource_info.function):
-                result = await resource_info.function()
-            else:
-                result = resource_info.function()
+            result = await resource_info.async_function()
             
-            return str(result)
+            return to_text(result)
         except Exception as e:
-            # Log error and re-raise with sanitized message
-            safe_uri = uri.replace('\n', '').replace('\r', '')[:100] if uri else 'None'
-            logger.error(f"Resource read failed for {safe_uri}: {str(e)[:100]}")
-            raise ValueError(f"Resource read failed: {str(e)[:100]}")
\ No newline at end of file
+            # The logger strips control characters from emitted records
+            error_msg = str(e)[:100]
+            logger.error("Resource read failed for %.100s: %s", uri, error_msg)
+            raise ValueError(f"Resource read failed: {error_msg}")
\ No newline at end of file
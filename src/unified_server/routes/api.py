@@ -4,18 +4,21 @@ Complete REST API for exposing MCP tools, resources, templates, and prompts.
 All MCP functionality available via standard REST endpoints.
 """
 
-from typing import Any, Dict, List, Optional
-from fastapi import APIRouter, HTTPException
+from typing import Any, Callable, Dict, List, Optional
+from fastapi import APIRouter, HTTPException, Request, Response
 from pydantic import BaseModel, Field
-import re
 
 from ..core.registry import registry
 from ..utils.logging import get_logger
-from ..utils.inspection import is_async_function
+from ..utils.validation import is_valid_name
+from ..utils.inspection import collect_result
+from ..utils.serialization import ORJSONResponse, dumps
+from .base import cached_json_response
 
 logger = get_logger("routes.api")
 
 
+
 # =============================================================================
 # REQUEST/RESPONSE MODELS
 # =============================================================================
@@ -145,13 +148,71 @@ class ErrorResponse(BaseModel):
     status_code: int
 
 
+# =============================================================================
+# LIST RESPONSES (encoded once per registry state via registry.cached)
+# =============================================================================
+
+def _build_tool_list() -> ToolListResponse:
+    tools = [
+        ToolInfo(name=name, description=info.description, parameters=info.parameters)
+        for name, info in registry.tools.items()
+    ]
+    return ToolListResponse(tools=tools, count=len(tools))
+
+
+def _build_resource_list() -> ResourceListResponse:
+    resources = [
+        ResourceInfo(
+            name=name,
+            uri=info.uri,
+            description=info.description,
+            mime_type=info.mime_type
+        )
+        for name, info in registry.resources.items()
+    ]
+    return ResourceListResponse(resources=resources, count=len(resources))
+
+
+def _build_template_list() -> ResourceTemplateListResponse:
+    templates = [
+        ResourceTemplateInfo(
+            name=name,
+            uri_template=info.uri_template,
+            description=info.description,
+            mime_type=info.mime_type,
+            parameters=info.parameters
+        )
+        for name, info in registry.resource_templates.items()
+    ]
+    return ResourceTemplateListResponse(templates=templates, count=len(templates))
+
+
+def _build_prompt_list() -> PromptListResponse:
+    prompts = [
+        PromptInfo(
+            name=name,
+            description=info.description,
+            arguments=info.arguments
+        )
+        for name, info in registry.prompts.items()
+    ]
+    return PromptListResponse(prompts=prompts, count=len(prompts))
+
+
+def _cached_json_response(
+    http_request: Request, key: Any, build: Callable[[], BaseModel]
+) -> Response:
+    """Serve a list response from bytes encoded once per registry state"""
+    return cached_json_response(http_request, key, lambda: dumps(build().model_dump()))
+
+
 # =============================================================================
 # ROUTER CREATION
 # =============================================================================
 
 def create_api_router() -> APIRouter:
     """Create REST API router"""
-    router = APIRouter(prefix="/api", tags=["REST API"])
+    router = APIRouter(prefix="/api", tags=["REST API"], default_response_class=ORJSONResponse)
 
     # =========================================================================
     # TOOLS
@@ -163,14 +224,10 @@ def create_api_router() -> APIRouter:
         summary="List all tools",
         description="Get a list of all registered tools with their descriptions and parameters"
     )
-    async def list_tools():
+    async def list_tools(http_request: Request):
         """List all available tools"""
         logger.info("API - List tools")
-        tools = [
-            ToolInfo(name=name, description=info.description, parameters=info.parameters)
-            for name, info in registry.tools.items()
-        ]
-        return ToolListResponse(tools=tools, count=len(tools))
+        return _cached_json_response(http_request, ("api", "tools"), _build_tool_list)
 
     @router.get(
         "/tools/{tool_name}",
@@ -178,34 +235,36 @@ def create_api_router() -> APIRouter:
         summary="Get tool information",
         description="Get detailed information about a specific tool by name"
     )
-    async def get_tool_info(tool_name: str):
-        """Get tool information"""
-        if not re.match(r'^[a-zA-Z0-9_-]+$', tool_name):
+    async def get_tool_info(tool_name: str, http_request: Request):
+        """Get tool information (encoded once per registry state)"""
+        if not is_valid_name(tool_name):
             raise HTTPException(status_code=400, detail="Invalid tool name")
 
-        logger.info(f"API - Get tool info: {tool_name}")
+        logger.info("API - Get tool info: %s", tool_name)
         tool_info = registry.get_tool(tool_name)
         if not tool_info:
             raise HTTPException(status_code=404, detail=f"Tool '{tool_name}' not found")
 
-        return ToolInfo(
+        return _cached_json_response(http_request, ("api", "tool", tool_name), lambda: ToolInfo(
             name=tool_name,
             description=tool_info.description,
             parameters=tool_info.parameters
-        )
+        ))
 
     @router.post(
         "/tools/{tool_name}",
-        response_model=ToolExecuteResponse,
+        response_model=None,
+        responses={200: {"model": ToolExecuteResponse}},
         summary="Execute a tool",
         description="Execute the named tool with provided arguments and return the result"
     )
-    async def execute_tool(tool_name: str, request: ToolExecuteRequest):
+    async def execute_tool(tool_name: str, request: ToolExecuteRequest, http_request: Request):
         """Execute a tool"""
-        if not re.match(r'^[a-zA-Z0-9_-]+$', tool_name):
+        if not is_valid_name(tool_name):
             raise HTTPException(status_code=400, detail="Invalid tool name")
 
-        if len(str(request.arguments)) > 10000:
+        # Measure the buffered raw body rather than building a repr
+        if len(await http_request.body()) > 10000:
             raise HTTPException(status_code=413, detail="Arguments too large")
 
         tool_info = registry.get_tool(tool_name)
@@ -213,20 +272,23 @@ def create_api_router() -> APIRouter:
             raise HTTPException(status_code=404, detail=f"Tool '{tool_name}' not found")
 
         try:
-            result = (
-                await tool_info.function(**request.arguments)
-                if is_async_function(tool_info.function)
-                else tool_info.function(**request.arguments)
-            )
-            logger.info(f"API - Tool {tool_name} executed successfully")
-            return ToolExecuteResponse(success=True, result=result, tool_name=tool_name)
+            tool_info.validate_arguments(request.arguments)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=f"Invalid arguments: {str(e)[:200]}")
+
+        try:
+            result = await tool_info.call_async(request.arguments)
+            result = await collect_result(result)
         except TypeError as e:
-            logger.error(f"API - Invalid arguments for {tool_name}: {e}")
+            logger.error("API - Invalid arguments for %s: %s", tool_name, e)
             raise HTTPException(status_code=400, detail=f"Invalid arguments: {str(e)}")
         except Exception as e:
-            logger.error(f"API - Tool {tool_name} execution failed: {e}")
+            logger.error("API - Tool %s execution failed: %s", tool_name, e)
             raise HTTPException(status_code=500, detail=f"Tool execution failed: {str(e)[:200]}")
 
+        logger.debug("API - Tool %s executed successfully", tool_name)
+        return ORJSONResponse({"success": True, "result": result, "tool_name": tool_name})
+
     # =========================================================================
     # RESOURCES
     # =========================================================================
@@ -237,29 +299,21 @@ def create_api_router() -> APIRouter:
         summary="List all resources",
         description="Get a list of all registered resources with their metadata"
     )
-    async def list_resources():
+    async def list_resources(http_request: Request):
         """List all resources"""
         logger.info("API - List resources")
-        resources = [
-            ResourceInfo(
-                name=name,
-                uri=info.uri,
-                description=info.description,
-                mime_type=info.mime_type
-            )
-            for name, info in registry.resources.items()
-        ]
-        return ResourceListResponse(resources=resources, count=len(resources))
+        return _cached_json_response(http_request, ("api", "resources"), _build_resource_list)
 
     @router.get(
         "/resources/{resource_name}",
-        response_model=ResourceReadResponse,
+        response_model=None,
+        responses={200: {"model": ResourceReadResponse}},
         summary="Read a resource by name",
         description="Read the content of a resource by its registered name"
     )
     async def read_resource_by_name(resource_name: str):
         """Read a resource by name"""
-        if not re.match(r'^[a-zA-Z0-9_-]+$', resource_name):
+        if not is_valid_name(resource_name):
             raise HTTPException(status_code=400, detail="Invalid resource name")
 
         resource_info = registry.get_resource(resource_name)
@@ -267,25 +321,23 @@ def create_api_router() -> APIRouter:
             raise HTTPException(status_code=404, detail=f"Resource '{resource_name}' not found")
 
         try:
-            content = (
-                await resource_info.function()
-                if is_async_function(resource_info.function)
-                else resource_info.function()
-            )
-            logger.info(f"API - Resource {resource_name} read successfully")
-            return ResourceReadResponse(
-                success=True,
-                uri=resource_info.uri,
-                content=content,
-                mime_type=resource_info.mime_type
-            )
+            content = await resource_info.async_function()
         except Exception as e:
-            logger.error(f"API - Resource {resource_name} read failed: {e}")
+            logger.error("API - Resource %s read failed: %s", resource_name, e)
             raise HTTPException(status_code=500, detail=f"Resource read failed: {str(e)[:200]}")
 
+        logger.debug("API - Resource %s read successfully", resource_name)
+        return ORJSONResponse({
+            "success": True,
+            "uri": resource_info.uri,
+            "content": content,
+            "mime_type": resource_info.mime_type
+        })
+
     @router.get(
         "/resources/by-uri",
-        response_model=ResourceReadResponse,
+        response_model=None,
+        responses={200: {"model": ResourceReadResponse}},
         summary="Read a resource by URI",
         description="Read the content of a resource using its exact URI"
     )
@@ -299,22 +351,19 @@ def create_api_router() -> APIRouter:
             raise HTTPException(status_code=404, detail=f"Resource with URI '{uri}' not found")
 
         try:
-            content = (
-                await resource_info.function()
-                if is_async_function(resource_info.function)
-                else resource_info.function()
-            )
-            logger.info(f"API - Resource read by URI succeeded")
-            return ResourceReadResponse(
-                success=True,
-                uri=uri,
-                content=content,
-                mime_type=resource_info.mime_type
-            )
+            content = await resource_info.async_function()
         except Exception as e:
-            logger.error(f"API - Resource read by URI failed: {e}")
+            logger.error("API - Resource read by URI failed: %s", e)
             raise HTTPException(status_code=500, detail=f"Resource read failed: {str(e)[:200]}")
 
+        logger.debug("API - Resource read by URI succeeded")
+        return ORJSONResponse({
+            "success": True,
+            "uri": uri,
+            "content": content,
+            "mime_type": resource_info.mime_type
+        })
+
     # =========================================================================
     # RESOURCE TEMPLATES
     # =========================================================================
@@ -325,20 +374,10 @@ def create_api_router() -> APIRouter:
         summary="List all resource templates",
         description="Get a list of registered resource templates and their parameters"
     )
-    async def list_resource_templates():
+    async def list_resource_templates(http_request: Request):
         """List all resource templates"""
         logger.info("API - List resource templates")
-        templates = [
-            ResourceTemplateInfo(
-                name=name,
-                uri_template=info.uri_template,
-                description=info.description,
-                mime_type=info.mime_type,
-                parameters=info.parameters
-            )
-            for name, info in registry.resource_templates.items()
-        ]
-        return ResourceTemplateListResponse(templates=templates, count=len(templates))
+        return _cached_json_response(http_request, ("api", "resource_templates"), _build_template_list)
 
     @router.get(
         "/resource-templates/{template_name}",
@@ -348,7 +387,7 @@ def create_api_router() -> APIRouter:
     )
     async def get_resource_template_info(template_name: str):
         """Get resource template information"""
-        if not re.match(r'^[a-zA-Z0-9_-]+$', template_name):
+        if not is_valid_name(template_name):
             raise HTTPException(status_code=400, detail="Invalid template name")
 
         template_info = registry.get_resource_template(template_name)
@@ -365,16 +404,20 @@ def create_api_router() -> APIRouter:
 
     @router.post(
         "/resource-templates/{template_name}",
-        response_model=ResourceReadResponse,
+        response_model=None,
+        responses={200: {"model": ResourceReadResponse}},
         summary="Read a resource template with parameters",
         description="Resolve a resource template with provided parameters, execute its function, and return content"
     )
-    async def read_resource_template(template_name: str, request: ResourceTemplateReadRequest):
+    async def read_resource_template(
+        template_name: str, request: ResourceTemplateReadRequest, http_request: Request
+    ):
         """Read resource template with parameters"""
-        if not re.match(r'^[a-zA-Z0-9_-]+$', template_name):
+        if not is_valid_name(template_name):
             raise HTTPException(status_code=400, detail="Invalid template name")
 
-        if len(str(request.parameters)) > 5000:
+        # Measure the buffered raw body rather than building a repr
+        if len(await http_request.body()) > 5000:
             raise HTTPException(status_code=413, detail="Parameters too large")
 
         template_info = registry.get_resource_template(template_name)
@@ -382,28 +425,26 @@ def create_api_router() -> APIRouter:
             raise HTTPException(status_code=404, detail=f"Template '{template_name}' not found")
 
         try:
-            # Resolve uri_template using provided parameters (may raise KeyError if missing)
-            resolved_uri = template_info.uri_template.format(**request.parameters)
-
-            content = (
-                await template_info.function(**request.parameters)
-                if is_async_function(template_info.function)
-                else template_info.function(**request.parameters)
-            )
-            logger.info(f"API - Resource template {template_name} read successfully")
-            return ResourceReadResponse(
-                success=True,
-                uri=resolved_uri,
-                content=content,
-                mime_type=template_info.mime_type
-            )
+            # Resolve uri_template from its pre-parsed segments (KeyError if missing)
+            resolved_uri = template_info.format_uri(request.parameters)
+
+            content = await template_info.async_function(**request.parameters)
+            content = await collect_result(content)
         except KeyError as e:
-            logger.error(f"API - Missing parameter for template {template_name}: {e}")
+            logger.error("API - Missing parameter for template %s: %s", template_name, e)
             raise HTTPException(status_code=400, detail=f"Missing template parameter: {e}")
         except Exception as e:
-            logger.error(f"API - Template read failed for {template_name}: {e}")
+            logger.error("API - Template read failed for %s: %s", template_name, e)
             raise HTTPException(status_code=500, detail=f"Template read failed: {str(e)[:200]}")
 
+        logger.debug("API - Resource template %s read successfully", template_name)
+        return ORJSONResponse({
+            "success": True,
+            "uri": resolved_uri,
+            "content": content,
+            "mime_type": template_info.mime_type
+        })
+
     # =========================================================================
     # PROMPTS
     # =========================================================================
@@ -414,18 +455,10 @@ def create_api_router() -> APIRouter:
         summary="List all prompts",
         description="Get a list of all registered prompts with their metadata"
     )
-    async def list_prompts():
+    async def list_prompts(http_request: Request):
         """List all prompts"""
         logger.info("API - List prompts")
-        prompts = [
-            PromptInfo(
-                name=name,
-                description=info.description,
-                arguments=info.arguments
-            )
-            for name, info in registry.prompts.items()
-        ]
-        return PromptListResponse(prompts=prompts, count=len(prompts))
+        return _cached_json_response(http_request, ("api", "prompts"), _build_prompt_list)
 
     @router.get(
         "/prompts/{prompt_name}",
@@ -435,7 +468,7 @@ def create_api_router() -> APIRouter:
     )
     async def get_prompt_info(prompt_name: str):
         """Get prompt information"""
-        if not re.match(r'^[a-zA-Z0-9_-]+$', prompt_name):
+        if not is_valid_name(prompt_name):
             raise HTTPException(status_code=400, detail="Invalid prompt name")
 
         prompt_info = registry.get_prompt(prompt_name)
@@ -450,16 +483,18 @@ def create_api_router() -> APIRouter:
 
     @router.post(
         "/prompts/{prompt_name}",
-        response_model=PromptExecuteResponse,
+        response_model=None,
+        responses={200: {"model": PromptExecuteResponse}},
         summary="Execute a prompt",
         description="Execute the named prompt with provided arguments and return generated messages"
     )
-    async def execute_prompt(prompt_name: str, request: PromptExecuteRequest):
+    async def execute_prompt(prompt_name: str, request: PromptExecuteRequest, http_request: Request):
         """Execute a prompt"""
-        if not re.match(r'^[a-zA-Z0-9_-]+$', prompt_name):
+        if not is_valid_name(prompt_name):
             raise HTTPException(status_code=400, detail="Invalid prompt name")
 
-        if len(str(request.arguments)) > 10000:
+        # Measure the buffered raw body rather than building a repr
+        if len(await http_request.body()) > 10000:
             raise HTTPException(status_code=413, detail="Arguments too large")
 
         prompt_info = registry.get_prompt(prompt_name)
@@ -467,25 +502,22 @@ def create_api_router() -> APIRouter:
             raise HTTPException(status_code=404, detail=f"Prompt '{prompt_name}' not found")
 
         try:
-            messages = (
-                await prompt_info.function(**request.arguments)
-                if is_async_function(prompt_info.function)
-                else prompt_info.function(**request.arguments)
-            )
-            logger.info(f"API - Prompt {prompt_name} executed successfully")
-            return PromptExecuteResponse(
-                success=True,
-                prompt_name=prompt_name,
-                description=prompt_info.description,
-                messages=messages
-            )
+            messages = await prompt_info.async_function(**request.arguments)
         except TypeError as e:
-            logger.error(f"API - Invalid arguments for prompt {prompt_name}: {e}")
+            logger.error("API - Invalid arguments for prompt %s: %s", prompt_name, e)
             raise HTTPException(status_code=400, detail=f"Invalid arguments: {str(e)}")
         except Exception as e:
-            logger.error(f"API - Prompt {prompt_name} execution failed: {e}")
+            logger.error("API - Prompt %s execution failed: %s", prompt_name, e)
             raise HTTPException(status_code=500, detail=f"Prompt execution failed: {str(e)[:200]}")
 
+        logger.debug("API - Prompt %s executed successfully", prompt_name)
+        return ORJSONResponse({
+            "success": True,
+            "prompt_name": prompt_name,
+            "description": prompt_info.description,
+            "messages": messages
+        })
+
     # =========================================================================
     # STATUS
     # =========================================================================
@@ -2,10 +2,50 @@
 Base routes for the unified server.
 """
 
-from fastapi import APIRouter
+import hashlib
+from collections.abc import Callable
+from typing import Any
+
+from fastapi import APIRouter, Request, Response
 
 from ..core.registry import registry
 from ..core.config import ServerConfig
+from ..utils.serialization import ORJSONResponse, dumps
+
+
+# Seconds clients may reuse a cached list response without revalidating
+LIST_MAX_AGE = 5
+
+
+def _with_etag(content: bytes) -> tuple[bytes, str]:
+    return content, '"' + hashlib.blake2b(content, digest_size=16).hexdigest() + '"'
+
+
+def cached_json_response(request: Request, key: Any, build: Callable[[], bytes]) -> Response:
+    """
+    Serve JSON bytes built once per registry state, with an ETag
+    
+    A request whose If-None-Match carries the current ETag gets an empty 304.
+    
+    Args:
+        request: Incoming request (for If-None-Match)
+        key: registry.cached key for the encoded payload
+        build: Returns the encoded JSON payload
+    
+    Returns:
+        Response with ETag and Cache-Control headers
+    """
+    content, etag = registry.cached(key, lambda: _with_etag(build()))
+    headers = {"ETag": etag, "Cache-Control": f"max-age={LIST_MAX_AGE}"}
+    
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and (
+        if_none_match.strip() == "*"
+        or etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    ):
+        return Response(status_code=304, headers=headers)
+    
+    return Response(content=content, media_type="application/json", headers=headers)
 
 
 def create_base_router(config: ServerConfig) -> APIRouter:
@@ -18,12 +58,13 @@ def create_base_router(config: ServerConfig) -> APIRouter:
     Returns:
         APIRouter instance
     """
-    router = APIRouter()
+    router = APIRouter(default_response_class=ORJSONResponse)
+    # The root payload embeds this router's config, so its cache key is unique
+    root_key = ("base", "root", object())
+    health_key = ("base", "health")
     
-    @router.get("/")
-    async def root():
-        """Root endpoint with server information"""
-        return {
+    def build_root() -> bytes:
+        return dumps({
             "name": config.name,
             "version": config.version,
             "tools": list(registry.tools.keys()),
@@ -40,16 +81,26 @@ def create_base_router(config: ServerConfig) -> APIRouter:
                     "endpoint": f"{config.mcp_endpoint} (POST for JSON-RPC)"
                 }
             }
-        }
+        })
     
-    @router.get("/health")
-    async def health():
-        """Health check endpoint"""
-        return {
+    def build_health() -> bytes:
+        return dumps({
             "status": "healthy",
             "tools": len(registry.tools),
             "resources": len(registry.resources),
             "prompts": len(registry.prompts)
-        }
+        })
+    
+    @router.get("/")
+    async def root():
+        """Root endpoint with server information (encoded once per registry state)"""
+        content = registry.cached(root_key, build_root)
+        return Response(content=content, media_type="application/json")
+    
+    @router.get("/health")
+    async def health():
+        """Health check endpoint (encoded once per registry state)"""
+        content = registry.cached(health_key, build_health)
+        return Response(content=content, media_type="application/json")
     
     return router
\ No newline at end of file
@@ -12,40 +12,86 @@ impractical to implement without SDK internals. Use WebSocket instead.
 import json
 import asyncio
 import re
+import weakref
 from uuid import uuid4
-from typing import Any, Dict, Optional
+from collections.abc import Awaitable, Callable
+from typing import Any, Literal
 
-from fastapi import APIRouter, Request, WebSocket, WebSocketDisconnect, HTTPException
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel, Field, validator
+from fastapi import APIRouter, Request, Response, WebSocket, WebSocketDisconnect, HTTPException
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
-from ..core.registry import registry
+from ..core.registry import ResourceInfo, ResourceTemplateInfo, registry
 from ..core.config import ServerConfig, MCPCapabilities
 from ..utils.logging import get_logger
-from ..utils.inspection import is_async_function
+from ..utils.validation import is_valid_name
+from ..utils.serialization import ORJSONResponse, dumps, loads, to_text
+from ..utils.inspection import collect_result
 
 logger = get_logger("routes.mcp")
 
+_METHOD_RE = re.compile(r'^[a-zA-Z0-9/_-]+$')
+
 # Validation models
 class MCPMessage(BaseModel):
-    jsonrpc: str = Field(default="2.0", pattern=r"^2\.0$")
+    model_config = ConfigDict(extra="ignore")
+    
+    jsonrpc: Literal["2.0"] = "2.0"
     method: str = Field(..., min_length=1, max_length=100)
-    params: Optional[Dict[str, Any]] = Field(default_factory=dict)
-    id: Optional[Any] = None
+    params: dict[str, Any] | None = None  # callers normalize None to {}
+    id: Any | None = None
     
-    @validator('method')
-    def validate_method(cls, v):
-        if not re.match(r'^[a-zA-Z0-9/_-]+$', v):
+    @field_validator('method')
+    @classmethod
+    def validate_method(cls, v: str) -> str:
+        if not _METHOD_RE.match(v):
             raise ValueError('Invalid method name')
         return v
 
 # Connection management
 MAX_CONNECTIONS = 100
-ws_connections: Dict[str, WebSocket] = {}
+# Admission gate (checked and taken without an intervening await) and a
+# registry of live sockets that does not keep dropped ones alive
+_ws_gate = asyncio.Semaphore(MAX_CONNECTIONS)
+ws_connections: "weakref.WeakValueDictionary[str, WebSocket]" = weakref.WeakValueDictionary()
+
+# Maximum number of requests accepted in one JSON-RPC batch
+MAX_BATCH_SIZE = 100
+
+
+def _error_frame(code: int, message: str) -> bytes:
+    return dumps({"jsonrpc": "2.0", "id": None, "error": {"code": code, "message": message}})
+
+
+# Constant error responses, encoded once
+_WS_ERR_TOO_LARGE = _error_frame(-32600, "Message too large")
+_WS_ERR_PARSE = _error_frame(-32700, "Parse error")
+_ERR_BAD_BATCH = _error_frame(-32600, "Invalid request: bad batch size")
+_ERR_INTERNAL = _error_frame(-32603, "Internal error")
+
+
+async def _send_frame(websocket: WebSocket, data: bytes, binary: bool) -> None:
+    """Send encoded JSON as a binary frame, or as text for text-frame clients"""
+    if binary:
+        await websocket.send_bytes(data)
+    else:
+        await websocket.send_text(data.decode("utf-8"))
+
+
+async def _receive_frame(websocket: WebSocket) -> tuple[bytes | str, bool]:
+    """Receive one frame as-is: (payload, is_binary), without decoding bytes"""
+    frame = await websocket.receive()
+    if frame["type"] == "websocket.disconnect":
+        raise WebSocketDisconnect(frame.get("code", 1000), frame.get("reason"))
+    data = frame.get("bytes")
+    if data is not None:
+        return data, True
+    return frame.get("text") or "", False
 
 
 def create_mcp_router(config: ServerConfig) -> APIRouter:
-    router = APIRouter(prefix=config.mcp_endpoint, tags=["mcp"])
+    router = APIRouter(
+        prefix=config.mcp_endpoint, tags=["mcp"], default_response_class=ORJSONResponse
+    )
 
     # =========================================================================
     # WEBSOCKET ENDPOINT (RECOMMENDED)
@@ -67,66 +113,76 @@ def create_mcp_router(config: ServerConfig) -> APIRouter:
             await ws.send(json.dumps({"jsonrpc": "2.0", "method": "initialize", ...}))
             response = await ws.recv()
         """
-        if len(ws_connections) >= MAX_CONNECTIONS:
+        if _ws_gate.locked():
             await websocket.close(code=1008)  # Policy violation
             return
         
-        await websocket.accept()
+        await _ws_gate.acquire()  # never waits: the gate was just seen open
         client_id = str(uuid4())
-        ws_connections[client_id] = websocket
-        
-        logger.info(f"WebSocket client connected: {client_id[:8]}...")
-        
-        # Send welcome message
-        await websocket.send_json({
-            "type": "connection",
-            "client_id": client_id,
-            "protocol": "MCP over WebSocket"
-        })
         
         try:
+            await websocket.accept()
+            ws_connections[client_id] = websocket
+            
+            logger.info("WebSocket client connected: %.8s...", client_id)
+            
+            # Send welcome message
+            await _send_frame(websocket, dumps({
+                "type": "connection",
+                "client_id": client_id,
+                "protocol": "MCP over WebSocket"
+            }), binary=False)
+            
             while True:
-                raw = await websocket.receive_text()
+                # Binary frames are parsed straight from bytes and answered in
+                # kind; text frames keep getting text replies
+                raw, binary = await _receive_frame(websocket)
                 
                 # Validate message size
                 if len(raw) > 1024 * 1024:  # 1MB
-                    await websocket.send_json({
-                        "jsonrpc": "2.0",
-                        "id": None,
-                        "error": {"code": -32600, "message": "Message too large"}
-                    })
+                    await _send_frame(websocket, _WS_ERR_TOO_LARGE, binary)
                     continue
                 
-                # Parse and validate
+                # Parse
                 try:
-                    raw_message = json.loads(raw)
-                    validated = MCPMessage(**raw_message)
-                    message = validated.dict()
+                    raw_message = loads(raw)
                 except json.JSONDecodeError:
-                    await websocket.send_json({
-                        "jsonrpc": "2.0",
-                        "id": None,
-                        "error": {"code": -32700, "message": "Parse error"}
-                    })
+                    await _send_frame(websocket, _WS_ERR_PARSE, binary)
                     continue
+                
+                # Batch: requests run concurrently, replies keep request order
+                if isinstance(raw_message, list):
+                    if not raw_message or len(raw_message) > MAX_BATCH_SIZE:
+                        await _send_frame(websocket, _ERR_BAD_BATCH, binary)
+                    else:
+                        responses = await process_batch(raw_message, config)
+                        await _send_frame(websocket, dumps(responses), binary)
+                    continue
+                
+                # Validate
+                try:
+                    message = MCPMessage(**raw_message)
                 except Exception as e:
-                    await websocket.send_json({
+                    await _send_frame(websocket, dumps({
                         "jsonrpc": "2.0",
                         "id": None,
                         "error": {"code": -32600, "message": f"Invalid request: {str(e)}"}
-                    })
+                    }), binary)
                     continue
                 
                 # Process message
-                response = await process_mcp_message(message, config)
-                await websocket.send_json(response)
+                response = await process_mcp_message(
+                    message.method, message.params or {}, message.id, config
+                )
+                await _send_frame(websocket, dumps(response), binary)
                 
         except WebSocketDisconnect:
-            logger.info(f"WebSocket client disconnected: {client_id[:8]}...")
+            logger.info("WebSocket client disconnected: %.8s...", client_id)
         except Exception as e:
-            logger.error(f"WebSocket error for {client_id[:8]}...: {e}")
+            logger.error("WebSocket error for %.8s...: %s", client_id, e)
         finally:
             ws_connections.pop(client_id, None)
+            _ws_gate.release()
 
     # =========================================================================
     # HTTP POST JSON-RPC ENDPOINT
@@ -145,6 +201,9 @@ def create_mcp_router(config: ServerConfig) -> APIRouter:
                 "http://localhost:8000/mcp",
                 json={"jsonrpc": "2.0", "method": "tools/list", "params": {}, "id": 1}
             )
+        
+        A JSON array of requests is handled as a JSON-RPC batch and answered
+        with an array of responses.
         """
         try:
             # Validate size
@@ -152,30 +211,46 @@ def create_mcp_router(config: ServerConfig) -> APIRouter:
             if content_length and int(content_length) > 1024 * 1024:
                 raise HTTPException(status_code=413, detail="Request too large")
             
-            raw_message = await request.json()
+            raw_message = loads(await request.body())
+            
+            # Batch
+            if isinstance(raw_message, list):
+                if not raw_message or len(raw_message) > MAX_BATCH_SIZE:
+                    return Response(
+                        _ERR_BAD_BATCH, status_code=400, media_type="application/json"
+                    )
+                
+                return ORJSONResponse(await process_batch(raw_message, config))
             
             # Validate
             try:
-                validated = MCPMessage(**raw_message)
-                message = validated.dict()
+                message = MCPMessage(**raw_message)
             except Exception as e:
-                return JSONResponse({
+                return ORJSONResponse({
                     "jsonrpc": "2.0",
                     "id": raw_message.get("id") if isinstance(raw_message, dict) else None,
                     "error": {"code": -32600, "message": f"Invalid request: {str(e)}"}
                 }, status_code=400)
             
+            # Listings are served from the registry's cached JSON
+            if message.method in _LISTING_JSON:
+                logger.info("MCP method: %s", message.method)
+                return Response(
+                    listing_response_json(message.method, message.id),
+                    media_type="application/json"
+                )
+            
             # Process
-            response = await process_mcp_message(message, config)
-            return JSONResponse(response)
+            response = await process_mcp_message(
+                message.method, message.params or {}, message.id, config
+            )
+            return ORJSONResponse(response)
             
         except Exception as e:
-            logger.error(f"JSON-RPC error: {e}")
-            return JSONResponse({
-                "jsonrpc": "2.0",
-                "id": None,
-                "error": {"code": -32603, "message": "Internal error"}
-            }, status_code=500)
+            logger.error("JSON-RPC error: %s", e)
+            return Response(
+                _ERR_INTERNAL, status_code=500, media_type="application/json"
+            )
 
     return router
 
@@ -184,38 +259,55 @@ def create_mcp_router(config: ServerConfig) -> APIRouter:
 # MESSAGE PROCESSOR
 # =============================================================================
 
-async def process_mcp_message(message: Dict[str, Any], config: ServerConfig) -> Dict[str, Any]:
-    """Process MCP JSON-RPC message and return response"""
-    method = message.get("method")
-    params = message.get("params", {})
-    msg_id = message.get("id")
+async def process_raw_message(raw_message: Any, config: ServerConfig) -> dict[str, Any]:
+    """Validate a decoded JSON-RPC message and process it, reporting errors in-band"""
+    try:
+        message = MCPMessage(**raw_message)
+    except Exception as e:
+        return {
+            "jsonrpc": "2.0",
+            "id": raw_message.get("id") if isinstance(raw_message, dict) else None,
+            "error": {"code": -32600, "message": f"Invalid request: {str(e)}"}
+        }
+    
+    return await process_mcp_message(
+        message.method, message.params or {}, message.id, config
+    )
+
+
+async def process_batch(raw_messages: list[Any], config: ServerConfig) -> list[dict[str, Any]]:
+    """
+    Process a JSON-RPC batch concurrently
     
-    # Sanitize for logging
-    safe_method = method.replace('\n', '').replace('\r', '')[:50] if method else 'None'
-    logger.info(f"MCP method: {safe_method}")
+    Errors are reported in-band per request, and responses keep the order
+    of the requests.
+    """
+    return list(await asyncio.gather(
+        *(process_raw_message(item, config) for item in raw_messages)
+    ))
+
+
+async def process_mcp_message(
+    method: str,
+    params: dict[str, Any],
+    msg_id: Any,
+    config: ServerConfig
+) -> dict[str, Any]:
+    """Process a validated MCP JSON-RPC message and return the response"""
+    # Formatted (and control characters stripped) only if INFO is enabled
+    logger.info("MCP method: %.50s", method)
     
     try:
+        # Dominant method: builds its own response, no table lookup
+        if method == "tools/call":
+            return await _fast_tools_call(params, msg_id)
+        
         # Route to handler
-        if method == "initialize":
-            result = await handle_initialize(config)
-        elif method == "notifications/initialized":
+        handler = _METHOD_HANDLERS.get(method)
+        if handler is not None:
+            result = await handler(params, config)
+        elif method in _NO_OP_METHODS:
             result = {}
-        elif method == "ping":
-            result = {}
-        elif method == "tools/list":
-            result = await handle_tools_list()
-        elif method == "tools/call":
-            result = await handle_tools_call(params)
-        elif method == "resources/list":
-            result = await handle_resources_list()
-        elif method == "resources/read":
-            result = await handle_resources_read(params)
-        elif method == "resources/templates/list":
-            result = {"resourceTemplates": []}
-        elif method == "prompts/list":
-            result = await handle_prompts_list()
-        elif method == "prompts/get":
-            result = await handle_prompts_get(params)
         else:
             return {
                 "jsonrpc": "2.0",
@@ -226,7 +318,7 @@ async def process_mcp_message(message: Dict[str, Any], config: ServerConfig) ->
         return {"jsonrpc": "2.0", "id": msg_id, "result": result}
         
     except Exception as e:
-        logger.error(f"Handler error: {str(e)[:200]}")
+        logger.error("Handler error: %.200s", e)
         return {
             "jsonrpc": "2.0",
             "id": msg_id,
@@ -238,7 +330,7 @@ async def process_mcp_message(message: Dict[str, Any], config: ServerConfig) ->
 # HANDLERS
 # =============================================================================
 
-async def handle_initialize(config: ServerConfig) -> Dict[str, Any]:
+async def handle_initialize(config: ServerConfig) -> dict[str, Any]:
     logger.info("Initialize connection")
     return {
         "protocolVersion": config.mcp_protocol_version,
@@ -247,8 +339,18 @@ async def handle_initialize(config: ServerConfig) -> Dict[str, Any]:
     }
 
 
-async def handle_tools_list() -> Dict[str, Any]:
-    logger.info(f"List tools: {len(registry.tools)}")
+def _tools_list_json() -> bytes:
+    # Splice each tool's pre-serialized schema instead of re-encoding it
+    tools = b",".join(
+        b'{"name":' + dumps(name)
+        + b',"description":' + dumps(info.description)
+        + b',"inputSchema":' + info.parameters_json + b"}"
+        for name, info in registry.tools.items()
+    )
+    return b'{"tools":[' + tools + b"]}"
+
+
+def _tools_list() -> dict[str, Any]:
     return {
         "tools": [
             {
@@ -261,37 +363,7 @@ async def handle_tools_list() -> Dict[str, Any]:
     }
 
 
-async def handle_tools_call(params: Dict[str, Any]) -> Dict[str, Any]:
-    tool_name = params.get("name")
-    arguments = params.get("arguments", {})
-    
-    # Validate
-    if not tool_name or len(tool_name) > 100:
-        raise ValueError("Invalid tool name")
-    if not re.match(r'^[a-zA-Z0-9_-]+$', tool_name):
-        raise ValueError("Invalid tool name format")
-    if len(str(arguments)) > 10000:
-        raise ValueError("Arguments too large")
-    
-    logger.info(f"Call tool: {tool_name}")
-    
-    tool_info = registry.get_tool(tool_name)
-    if not tool_info:
-        raise ValueError(f"Tool not found: {tool_name}")
-    
-    try:
-        if is_async_function(tool_info.function):
-            result = await tool_info.function(**arguments)
-        else:
-            result = tool_info.function(**arguments)
-    except Exception as e:
-        raise ValueError(f"Tool execution failed: {str(e)[:200]}")
-    
-    return {"content": [{"type": "text", "text": str(result)}]}
-
-
-async def handle_resources_list() -> Dict[str, Any]:
-    logger.info(f"List resources: {len(registry.resources)}")
+def _resources_list() -> dict[str, Any]:
     return {
         "resources": [
             {
@@ -305,74 +377,189 @@ async def handle_resources_list() -> Dict[str, Any]:
     }
 
 
-async def handle_resources_read(params: Dict[str, Any]) -> Dict[str, Any]:
+def _resource_templates_list() -> dict[str, Any]:
+    return {
+        "resourceTemplates": [
+            {
+                "uriTemplate": info.uri_template,
+                "name": name,
+                "description": info.description,
+                "mimeType": info.mime_type
+            }
+            for name, info in registry.resource_templates.items()
+        ]
+    }
+
+
+def _prompts_list() -> dict[str, Any]:
+    return {
+        "prompts": [
+            {
+                "name": name,
+                "description": info.description,
+                "arguments": info.arguments
+            }
+            for name, info in registry.prompts.items()
+        ]
+    }
+
+
+# Listing methods whose results depend only on the registry. Cached results
+# are shared between requests and must be treated as read-only.
+_LISTING_JSON = {
+    "tools/list": _tools_list_json,
+    "resources/list": lambda: dumps(_resources_list()),
+    "resources/templates/list": lambda: dumps(_resource_templates_list()),
+    "prompts/list": lambda: dumps(_prompts_list()),
+}
+
+
+def listing_response_json(method: str, msg_id: Any) -> bytes:
+    """Encode a complete listing response around the registry's cached result JSON"""
+    result = registry.cached(("mcp", method), _LISTING_JSON[method])
+    return b'{"jsonrpc":"2.0","id":' + dumps(msg_id) + b',"result":' + result + b"}"
+
+
+async def handle_tools_list() -> dict[str, Any]:
+    logger.info("List tools: %s", len(registry.tools))
+    return registry.cached(("mcp_result", "tools/list"), _tools_list)
+
+
+def _invalid_params(msg_id: Any, message: str) -> dict[str, Any]:
+    return {"jsonrpc": "2.0", "id": msg_id, "error": {"code": -32602, "message": message}}
+
+
+async def _fast_tools_call(params: dict[str, Any], msg_id: Any) -> dict[str, Any]:
+    """
+    tools/call, answered directly as a complete JSON-RPC response
+    
+    Bad names, unknown tools and rejected arguments are -32602 (invalid
+    params); failures inside the tool propagate to process_mcp_message.
+    """
+    tool_name = params.get("name")
+    if not isinstance(tool_name, str) or not tool_name or len(tool_name) > 100:
+        return _invalid_params(msg_id, "Invalid tool name")
+    if not is_valid_name(tool_name):
+        return _invalid_params(msg_id, "Invalid tool name format")
+    
+    tool_info = registry.tools.get(tool_name)
+    if tool_info is None:
+        return _invalid_params(msg_id, f"Tool not found: {tool_name}")
+    
+    arguments = params.get("arguments") or {}
+    if arguments and len(dumps(arguments)) > 10000:
+        return _invalid_params(msg_id, "Arguments too large")
+    try:
+        tool_info.validate_arguments(arguments)
+    except ValueError as e:
+        return _invalid_params(msg_id, f"Invalid arguments: {str(e)[:200]}")
+    
+    logger.info("Call tool: %s", tool_name)
+    
+    try:
+        result = await tool_info.call_async(arguments)
+        result = await collect_result(result)
+    except Exception as e:
+        raise ValueError(f"Tool execution failed: {str(e)[:200]}")
+    
+    return {
+        "jsonrpc": "2.0",
+        "id": msg_id,
+        "result": {"content": [{"type": "text", "text": to_text(result)}]}
+    }
+
+
+async def handle_resources_list() -> dict[str, Any]:
+    logger.info("List resources: %s", len(registry.resources))
+    return registry.cached(("mcp_result", "resources/list"), _resources_list)
+
+
+async def handle_resource_templates_list() -> dict[str, Any]:
+    logger.info("List resource templates: %s", len(registry.resource_templates))
+    return registry.cached(("mcp_result", "resources/templates/list"), _resource_templates_list)
+
+
+async def handle_resources_read(params: dict[str, Any]) -> dict[str, Any]:
     uri = params.get("uri")
     
     # Validate
     if not uri or len(uri) > 500:
         raise ValueError("Invalid URI")
     
-    logger.info(f"Read resource: {uri[:100]}")
+    logger.info("Read resource: %.100s", uri)
     
+    source: ResourceInfo | ResourceTemplateInfo
+    template_params: dict[str, str] = {}
     resource_info = registry.get_resource_by_uri(uri)
-    if not resource_info:
-        raise ValueError(f"Resource not found: {uri}")
+    if resource_info is not None:
+        source = resource_info
+    else:
+        # Fall back to resource templates
+        matched = registry.match_resource_template(uri)
+        if not matched:
+            raise ValueError(f"Resource not found: {uri}")
+        template_info, template_params = matched
+        source = template_info
     
     try:
-        if is_async_function(resource_info.function):
-            content = await resource_info.function()
-        else:
-            content = resource_info.function()
+        content = await source.async_function(**template_params)
     except Exception as e:
         raise ValueError(f"Resource read failed: {str(e)[:200]}")
     
     return {
         "contents": [{
             "uri": uri,
-            "mimeType": resource_info.mime_type,
-            "text": str(content)
+            "mimeType": source.mime_type,
+            "text": to_text(content)
         }]
     }
 
 
-async def handle_prompts_list() -> Dict[str, Any]:
-    logger.info(f"List prompts: {len(registry.prompts)}")
-    return {
-        "prompts": [
-            {
-                "name": name,
-                "description": info.description,
-                "arguments": info.arguments
-            }
-            for name, info in registry.prompts.items()
-        ]
-    }
+async def handle_prompts_list() -> dict[str, Any]:
+    logger.info("List prompts: %s", len(registry.prompts))
+    return registry.cached(("mcp_result", "prompts/list"), _prompts_list)
 
 
-async def handle_prompts_get(params: Dict[str, Any]) -> Dict[str, Any]:
+async def handle_prompts_get(params: dict[str, Any]) -> dict[str, Any]:
     prompt_name = params.get("name")
     arguments = params.get("arguments", {})
     
     # Validate
     if not prompt_name or len(prompt_name) > 100:
         raise ValueError("Invalid prompt name")
-    if not re.match(r'^[a-zA-Z0-9_-]+$', prompt_name):
+    if not is_valid_name(prompt_name):
         raise ValueError("Invalid prompt name format")
-    if len(str(arguments)) > 10000:
+    if arguments and len(dumps(arguments)) > 10000:
         raise ValueError("Arguments too large")
     
-    logger.info(f"Get prompt: {prompt_name}")
+    logger.info("Get prompt: %s", prompt_name)
     
     prompt_info = registry.get_prompt(prompt_name)
     if not prompt_info:
         raise ValueError(f"Prompt not found: {prompt_name}")
     
     try:
-        if is_async_function(prompt_info.function):
-            messages = await prompt_info.function(**arguments)
-        else:
-            messages = prompt_info.function(**arguments)
+        messages = await prompt_info.async_function(**arguments)
     except Exception as e:
         raise ValueError(f"Prompt execution failed: {str(e)[:200]}")
     
-    return {"description": prompt_info.description, "messages": messages}
\ No newline at end of file
+    return {"description": prompt_info.description, "messages": messages}
+
+
+# =============================================================================
+# DISPATCH TABLE
+# =============================================================================
+
+# method -> handler(params, config)
+_METHOD_HANDLERS: dict[str, Callable[[dict[str, Any], ServerConfig], Awaitable[dict[str, Any]]]] = {
+    "initialize": lambda params, config: handle_initialize(config),
+    "tools/list": lambda params, config: handle_tools_list(),
+    "resources/list": lambda params, config: handle_resources_list(),
+    "resources/read": lambda params, config: handle_resources_read(params),
+    "resources/templates/list": lambda params, config: handle_resource_templates_list(),
+    "prompts/list": lambda params, config: handle_prompts_list(),
+    "prompts/get": lambda params, config: handle_prompts_get(params),
+}
+
+# Methods acknowledged with an empty result
+_NO_OP_METHODS = frozenset({"notifications/initialized", "ping"})
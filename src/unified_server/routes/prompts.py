@@ -2,17 +2,54 @@
 Routes for prompt management and generation.
 """
 
-from typing import Dict, Optional
+import asyncio
+import logging
+from typing import Any
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
+from pydantic import BaseModel, Field
 
 from ..core.registry import registry
-from ..utils.logging import get_logger
-from ..utils.inspection import is_async_function
+from ..utils.logging import get_logger, payload_repr
+from ..utils.serialization import ORJSONResponse, dumps
+from .base import cached_json_response
 
 
 logger = get_logger("routes.prompts")
 
+# Maximum number of calls accepted by POST /prompts/batch
+MAX_BATCH_SIZE = 100
+
+
+class PromptCall(BaseModel):
+    """One entry of a prompt batch"""
+    name: str
+    arguments: dict[str, str] = Field(default_factory=dict)
+
+
+async def _get_batch_prompt(call: PromptCall) -> dict[str, Any]:
+    """Render one batched prompt, reporting failures in-band"""
+    prompt_info = registry.get_prompt(call.name)
+    if not prompt_info:
+        return {"name": call.name, "error": "Prompt not found"}
+    
+    # Same limits as the single-prompt endpoint
+    arguments = call.arguments
+    if len(arguments) > 20:
+        return {"name": call.name, "error": "Too many arguments"}
+    if any(len(key) > 50 or len(value) > 1000 for key, value in arguments.items()):
+        return {"name": call.name, "error": "Argument too large"}
+    
+    try:
+        result = await prompt_info.async_function(**arguments)
+        return {"name": call.name, "messages": result, "description": prompt_info.description}
+    except TypeError as e:
+        return {"name": call.name, "error": f"Invalid arguments: {str(e)[:100]}"}
+    except Exception as e:
+        error_msg = str(e)[:100]
+        logger.error("Prompt %s failed in batch: %s", call.name[:50], error_msg)
+        return {"name": call.name, "error": f"Prompt execution failed: {error_msg}"}
+
 
 def create_prompts_router() -> APIRouter:
     """
@@ -21,12 +58,14 @@ def create_prompts_router() -> APIRouter:
     Returns:
         APIRouter instance
     """
-    router = APIRouter(prefix="/prompts", tags=["prompts"])
+    router = APIRouter(prefix="/prompts", tags=["prompts"], default_response_class=ORJSONResponse)
+    # Bound once per router instead of looked up on every request
+    lookup_prompt = registry.get_prompt
     
     @router.get("")
-    async def list_prompts():
-        """List all available prompts"""
-        return {
+    async def list_prompts(request: Request):
+        """List all available prompts (encoded once per registry state)"""
+        return cached_json_response(request, ("legacy", "prompts"), lambda: dumps({
             "prompts": [
                 {
                     "name": name,
@@ -35,10 +74,23 @@ def create_prompts_router() -> APIRouter:
                 }
                 for name, info in registry.prompts.items()
             ]
-        }
+        }))
+    
+    # Registered before /{prompt_name} so "batch" is not taken as a prompt name
+    @router.post("/batch")
+    async def get_prompt_batch(calls: list[PromptCall]):
+        """Render several prompts concurrently; results keep the request order"""
+        if not calls or len(calls) > MAX_BATCH_SIZE:
+            raise HTTPException(status_code=400, detail="Invalid batch size")
+        
+        logger.info("REST API - Getting batch of %d prompts", len(calls))
+        results = await asyncio.gather(*(_get_batch_prompt(call) for call in calls))
+        return {"results": results}
     
     @router.post("/{prompt_name}")
-    async def get_prompt(prompt_name: str, arguments: Optional[Dict[str, str]] = None):
+    async def get_prompt(
+        prompt_name: str, request: Request, arguments: dict[str, str] | None = None
+    ):
         """Get a prompt with given arguments"""
         # Validate prompt name
         if not prompt_name or len(prompt_name) > 100:
@@ -52,49 +104,47 @@ def create_prompts_router() -> APIRouter:
                 if len(str(key)) > 50 or len(str(value)) > 1000:
                     raise HTTPException(status_code=400, detail="Argument too large")
         
-        # Sanitize logging to prevent injection
-        safe_prompt_name = prompt_name.replace('\n', '').replace('\r', '')[:50]
-        logger.info(f"REST API - Getting prompt: {safe_prompt_name}")
-        if arguments:
-            safe_args = str(arguments)[:200].replace('\n', '').replace('\r', '')
-            logger.info(f"   Arguments: {safe_args}")
+        # Truncated only; the logger's ControlCharFilter strips CR/LF from
+        # records that are actually emitted
+        safe_prompt_name = prompt_name[:50]
         
-        prompt_info = registry.get_prompt(prompt_name)
+        prompt_info = lookup_prompt(prompt_name)
         if not prompt_info:
-            logger.warning(f"Prompt not found: {safe_prompt_name}")
+            logger.warning("Prompt not found: %s", safe_prompt_name)
             raise HTTPException(status_code=404, detail=f"Prompt not found")
         
+        logger.info("REST API - Getting prompt: %s", safe_prompt_name)
+        if arguments and logger.isEnabledFor(logging.INFO):
+            logger.info("   Arguments: %s", payload_repr(arguments))
+        
         try:
-            # Validate arguments size
-            if arguments and len(str(arguments)) > 10000:  # 10KB limit
+            # Validate arguments size on the buffered raw body
+            if arguments and len(await request.body()) > 10000:  # 10KB limit
                 raise HTTPException(status_code=413, detail="Arguments too large")
                 
-            if is_async_function(prompt_info.function):
-                result = await prompt_info.function(**(arguments or {}))
-            else:
-                result = prompt_info.function(**(arguments or {}))
+            result = await prompt_info.async_function(**(arguments or {}))
             
-            logger.info(f"Prompt {safe_prompt_name} generated successfully")
+            logger.debug("Prompt %s generated successfully", safe_prompt_name)
             return {
                 "messages": result,
                 "description": prompt_info.description
             }
         except TypeError as e:
             error_msg = str(e)[:100]
-            logger.error(f"Invalid arguments for prompt {safe_prompt_name}: {error_msg}")
+            logger.error("Invalid arguments for prompt %s: %s", safe_prompt_name, error_msg)
             raise HTTPException(
                 status_code=400,
                 detail=f"Invalid arguments: {error_msg}"
             )
         except Exception as e:
             error_msg = str(e)[:100]
-            logger.error(f"Prompt {safe_prompt_name} failed: {error_msg}")
+            logger.error("Prompt %s failed: %s", safe_prompt_name, error_msg)
             raise HTTPException(status_code=500, detail=f"Prompt execution failed: {error_msg}")
     
     @router.get("/{prompt_name}")
     async def get_prompt_info(prompt_name: str):
         """Get information about a specific prompt"""
-        prompt_info = registry.get_prompt(prompt_name)
+        prompt_info = lookup_prompt(prompt_name)
         if not prompt_info:
             raise HTTPException(status_code=404, detail=f"Prompt '{prompt_name}' not found")
         
@@ -2,15 +2,51 @@
 Routes for resource management and reading.
 """
 
-from fastapi import APIRouter, HTTPException
+import asyncio
+from typing import Any
+
+from fastapi import APIRouter, HTTPException, Request
+from pydantic import BaseModel
 
 from ..core.registry import registry
 from ..utils.logging import get_logger
-from ..utils.inspection import is_async_function
+from ..utils.serialization import ORJSONResponse, dumps
+from .base import cached_json_response
 
 
 logger = get_logger("routes.resources")
 
+# HTML-escapes user input before it is logged
+_XSS_TABLE = str.maketrans({"<": "&lt;", ">": "&gt;", '"': "&quot;"})
+
+# Maximum number of reads accepted by POST /resources/batch
+MAX_BATCH_SIZE = 100
+
+
+class ResourceRead(BaseModel):
+    """One entry of a resource batch"""
+    name: str
+
+
+async def _read_batch_resource(read: ResourceRead) -> dict[str, Any]:
+    """Read one batched resource, reporting failures in-band"""
+    resource_info = registry.get_resource(read.name)
+    if not resource_info:
+        return {"name": read.name, "error": "Resource not found"}
+    
+    try:
+        result = await resource_info.async_function()
+        return {
+            "name": read.name,
+            "content": result,
+            "uri": resource_info.uri,
+            "mimeType": resource_info.mime_type
+        }
+    except Exception as e:
+        error_msg = str(e)[:100]
+        logger.error("Resource %s failed in batch: %s", read.name[:50].translate(_XSS_TABLE), error_msg)
+        return {"name": read.name, "error": f"Resource read failed: {error_msg}"}
+
 
 def create_resources_router() -> APIRouter:
     """
@@ -19,12 +55,15 @@ def create_resources_router() -> APIRouter:
     Returns:
         APIRouter instance
     """
-    router = APIRouter(prefix="/resources", tags=["resources"])
+    router = APIRouter(prefix="/resources", tags=["resources"], default_response_class=ORJSONResponse)
+    # Bound once per router instead of looked up on every request
+    get_resource = registry.get_resource
+    get_resource_by_uri = registry.get_resource_by_uri
     
     @router.get("")
-    async def list_resources():
-        """List all available resources"""
-        return {
+    async def list_resources(request: Request):
+        """List all available resources (encoded once per registry state)"""
+        return cached_json_response(request, ("legacy", "resources"), lambda: dumps({
             "resources": [
                 {
                     "uri": info.uri,
@@ -34,7 +73,17 @@ def create_resources_router() -> APIRouter:
                 }
                 for name, info in registry.resources.items()
             ]
-        }
+        }))
+    
+    @router.post("/batch")
+    async def read_resource_batch(reads: list[ResourceRead]):
+        """Read several resources concurrently; results keep the request order"""
+        if not reads or len(reads) > MAX_BATCH_SIZE:
+            raise HTTPException(status_code=400, detail="Invalid batch size")
+        
+        logger.info("REST API - Reading batch of %d resources", len(reads))
+        results = await asyncio.gather(*(_read_batch_resource(read) for read in reads))
+        return {"results": results}
     
     @router.get("/{resource_name}")
     async def read_resource(resource_name: str):
@@ -44,21 +93,19 @@ def create_resources_router() -> APIRouter:
             raise HTTPException(status_code=400, detail="Invalid resource name")
         
         # Sanitize for XSS prevention
-        safe_resource_name = resource_name.replace('<', '&lt;').replace('>', '&gt;').replace('"', '&quot;')[:50]
-        logger.info(f"REST API - Reading resource: {safe_resource_name}")
+        safe_resource_name = resource_name[:50].translate(_XSS_TABLE)
         
-        resource_info = registry.get_resource(resource_name)
+        resource_info = get_resource(resource_name)
         if not resource_info:
-            logger.warning(f"Resource not found: {safe_resource_name}")
+            logger.warning("Resource not found: %s", safe_resource_name)
             raise HTTPException(status_code=404, detail=f"Resource not found")
         
+        logger.info("REST API - Reading resource: %s", safe_resource_name)
+        
         try:
-            if is_async_function(resource_info.function):
-                result = await resource_info.function()
-            else:
-                result = resource_info.function()
+            result = await resource_info.async_function()
             
-            logger.info(f"Resource {safe_resource_name} read successfully")
+            logger.debug("Resource %s read successfully", safe_resource_name)
             return {
                 "content": result,
                 "uri": resource_info.uri,
@@ -66,7 +113,7 @@ def create_resources_router() -> APIRouter:
             }
         except Exception as e:
             error_msg = str(e)[:100]
-            logger.error(f"Resource {safe_resource_name} failed: {error_msg}")
+            logger.error("Resource %s failed: %s", safe_resource_name, error_msg)
             raise HTTPException(status_code=500, detail=f"Resource read failed: {error_msg}")
     
     @router.get("/by-uri/{uri:path}")
@@ -77,21 +124,19 @@ def create_resources_router() -> APIRouter:
             raise HTTPException(status_code=400, detail="Invalid URI")
             
         # Sanitize for XSS prevention
-        safe_uri = uri.replace('<', '&lt;').replace('>', '&gt;').replace('"', '&quot;')[:100]
-        logger.info(f"REST API - Reading resource by URI: {safe_uri}")
+        safe_uri = uri[:100].translate(_XSS_TABLE)
         
-        resource_info = registry.get_resource_by_uri(uri)
+        resource_info = get_resource_by_uri(uri)
         if not resource_info:
-            logger.warning(f"Resource not found for URI: {safe_uri}")
+            logger.warning("Resource not found for URI: %s", safe_uri)
             raise HTTPException(status_code=404, detail=f"Resource not found")
         
+        logger.info("REST API - Reading resource by URI: %s", safe_uri)
+        
         try:
-            if is_async_function(resource_info.function):
-                result = await resource_info.function()
-            else:
-                result = resource_info.function()
+            result = await resource_info.async_function()
             
-            logger.info(f"Resource read successfully")
+            logger.debug("Resource read successfully")
             return {
                 "content": result,
                 "uri": resource_info.uri,
@@ -99,7 +144,7 @@ def create_resources_router() -> APIRouter:
             }
         except Exception as e:
             error_msg = str(e)[:100]
-            logger.error(f"Resource failed: {error_msg}")
+            logger.error("Resource failed: %s", error_msg)
             raise HTTPException(status_code=500, detail=f"Resource read failed: {error_msg}")
     
     return router
\ No newline at end of file
@@ -2,17 +2,73 @@
 Routes for tool management and execution.
 """
 
-from typing import Any, Dict
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+from typing import Any
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field
+from starlette.concurrency import iterate_in_threadpool
 
 from ..core.registry import registry
-from ..utils.logging import get_logger
-from ..utils.inspection import is_async_function
+from ..utils.logging import get_logger, payload_repr
+from ..utils.inspection import collect_result, is_result_stream
+from ..utils.serialization import ORJSONResponse, dumps, loads
+from .base import cached_json_response
 
 
 logger = get_logger("routes.tools")
 
+# OpenAPI description of the raw JSON body read by execute_tool
+_PARAMS_BODY_DOC = {
+    "requestBody": {
+        "required": True,
+        "content": {"application/json": {"schema": {"type": "object"}}},
+    }
+}
+
+# Maximum number of calls accepted by POST /tools/batch
+MAX_BATCH_SIZE = 100
+
+
+class ToolCall(BaseModel):
+    """One entry of a tool batch"""
+    name: str
+    params: dict[str, Any] = Field(default_factory=dict)
+
+
+async def _execute_batch_call(call: ToolCall) -> dict[str, Any]:
+    """Run one batched tool call, reporting failures in-band"""
+    tool_info = registry.get_tool(call.name)
+    if not tool_info:
+        return {"name": call.name, "error": f"Tool '{call.name}' not found"}
+    
+    try:
+        tool_info.validate_arguments(call.params)
+        
+        result = await tool_info.call_async(call.params)
+        return {"name": call.name, "result": await collect_result(result)}
+    except (TypeError, ValueError) as e:
+        return {"name": call.name, "error": f"Invalid parameters: {str(e)[:100]}"}
+    except Exception as e:
+        error_msg = str(e)[:100]
+        logger.error("Tool %s failed in batch: %s", call.name[:50], error_msg)
+        return {"name": call.name, "error": f"Tool execution failed: {error_msg}"}
+
+
+async def _ndjson_stream(result: Any, tool_name: str) -> AsyncIterator[bytes]:
+    """Encode generator items as newline-delimited JSON as they are produced"""
+    try:
+        # Sync generators advance in the threadpool, like sync tool calls
+        items = result if hasattr(result, "__aiter__") else iterate_in_threadpool(result)
+        async for item in items:
+            yield dumps(item) + b"\n"
+    except Exception as e:
+        # Headers are already sent; log and end the stream
+        logger.error("Tool %s failed while streaming: %s", tool_name, str(e)[:100])
+
 
 def create_tools_router() -> APIRouter:
     """
@@ -21,12 +77,14 @@ def create_tools_router() -> APIRouter:
     Returns:
         APIRouter instance
     """
-    router = APIRouter(prefix="/tools", tags=["tools"])
+    router = APIRouter(prefix="/tools", tags=["tools"], default_response_class=ORJSONResponse)
+    # Bound once per router instead of looked up on every request
+    get_tool = registry.get_tool
     
     @router.get("")
-    async def list_tools():
-        """List all available tools"""
-        return {
+    async def list_tools(request: Request):
+        """List all available tools (encoded once per registry state)"""
+        return cached_json_response(request, ("legacy", "tools"), lambda: dumps({
             "tools": [
                 {
                     "name": name,
@@ -35,56 +93,93 @@ def create_tools_router() -> APIRouter:
                 }
                 for name, info in registry.tools.items()
             ]
-        }
+        }))
     
-    @router.post("/{tool_name}")
-    async def execute_tool(tool_name: str, params: Dict[str, Any]):
+    # Registered before /{tool_name} so "batch" is not taken as a tool name
+    @router.post("/batch")
+    async def execute_batch(calls: list[ToolCall], request: Request):
+        """Execute several tools concurrently; results keep the request order"""
+        if not calls or len(calls) > MAX_BATCH_SIZE:
+            raise HTTPException(status_code=400, detail="Invalid batch size")
+        # Same 10KB-per-call budget as execute_tool, checked on the buffered body
+        if len(await request.body()) > 10000 * len(calls):
+            raise HTTPException(status_code=413, detail="Parameters too large")
+        
+        logger.info("REST API - Executing batch of %d tools", len(calls))
+        results = await asyncio.gather(*(_execute_batch_call(call) for call in calls))
+        return {"results": results}
+    
+    @router.post("/{tool_name}", openapi_extra=_PARAMS_BODY_DOC)
+    async def execute_tool(tool_name: str, request: Request):
         """Execute a tool with given parameters"""
-        # Sanitize logging to prevent injection
-        safe_tool_name = tool_name.replace('\n', '').replace('\r', '')[:50]
-        safe_params = str(params)[:200].replace('\n', '').replace('\r', '')
-        logger.info(f"REST API - Executing tool: {safe_tool_name} with params: {safe_params}")
+        # Truncated only; the logger's ControlCharFilter strips CR/LF from
+        # records that are actually emitted
+        safe_tool_name = tool_name[:50]
         
-        tool_info = registry.get_tool(tool_name)
+        tool_info = get_tool(tool_name)
         if not tool_info:
-            logger.warning(f"Tool not found: {safe_tool_name}")
+            logger.warning("Tool not found: %s", safe_tool_name)
             raise HTTPException(status_code=404, detail=f"Tool '{tool_name}' not found")
         
+        # Parsed directly rather than through a validated Dict[str, Any]
+        # parameter; the tool's own validator checks the arguments below
+        body = await request.body()
+        if len(body) > 10000:  # 10KB limit
+            raise HTTPException(status_code=413, detail="Parameters too large")
         try:
-            # Validate params size
-            if len(str(params)) > 10000:  # 10KB limit
-                raise HTTPException(status_code=413, detail="Parameters too large")
-                
-            if is_async_function(tool_info.function):
-                result = await tool_info.function(**params)
-            else:
-                result = tool_info.function(**params)
+            params = loads(body)
+        except ValueError:
+            params = None
+        if not isinstance(params, dict):
+            raise HTTPException(status_code=422, detail="Request body must be a JSON object")
+        
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "REST API - Executing tool: %s with params: %s",
+                safe_tool_name, payload_repr(params)
+            )
+        
+        try:
+            tool_info.validate_arguments(params)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=f"Invalid parameters: {str(e)[:100]}")
+        
+        try:
+            result = await tool_info.call_async(params)
+            
+            # Generators are streamed as NDJSON instead of being materialized
+            if is_result_stream(result):
+                logger.debug("Tool %s streaming results", safe_tool_name)
+                return StreamingResponse(
+                    _ndjson_stream(result, safe_tool_name),
+                    media_type="application/x-ndjson"
+                )
             
-            logger.info(f"Tool {safe_tool_name} completed successfully")
+            logger.debug("Tool %s completed successfully", safe_tool_name)
             return {"result": result}
         except TypeError as e:
             error_msg = str(e)[:100]
-            logger.error(f"Invalid parameters for tool {safe_tool_name}: {error_msg}")
+            logger.error("Invalid parameters for tool %s: %s", safe_tool_name, error_msg)
             raise HTTPException(
                 status_code=400, 
                 detail=f"Invalid parameters: {error_msg}"
             )
         except Exception as e:
             error_msg = str(e)[:100]
-            logger.error(f"Tool {safe_tool_name} failed: {error_msg}")
+            logger.error("Tool %s failed: %s", safe_tool_name, error_msg)
             raise HTTPException(status_code=500, detail=f"Tool execution failed: {error_msg}")
     
     @router.get("/{tool_name}")
-    async def get_tool_info(tool_name: str):
-        """Get information about a specific tool"""
-        tool_info = registry.get_tool(tool_name)
+    async def get_tool_info(tool_name: str, request: Request):
+        """Get information about a specific tool (encoded once per registry state)"""
+        tool_info = get_tool(tool_name)
         if not tool_info:
             raise HTTPException(status_code=404, detail=f"Tool '{tool_name}' not found")
         
-        return {
+        return cached_json_response(request, ("legacy", "tool", tool_name), lambda: dumps({
             "name": tool_name,
             "description": tool_info.description,
             "parameters": tool_info.parameters
-        }
+        }))
     
     return router
\ No newline at end of file
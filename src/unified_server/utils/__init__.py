@@ -1,16 +1,28 @@
 """Utility functions"""
 
-from .logging import setup_logging, get_logger
+from .logging import setup_logging, get_logger, payload_repr
 from .inspection import (
+    get_signature,
     get_parameter_schema,
     is_async_function,
+    is_result_stream,
+    collect_result,
     get_function_description,
 )
+from .serialization import dumps, loads, to_text, ORJSONResponse
 
 __all__ = [
     "setup_logging",
     "get_logger",
+    "payload_repr",
+    "get_signature",
     "get_parameter_schema",
     "is_async_function",
+    "is_result_stream",
+    "collect_result",
     "get_function_description",
+    "dumps",
+    "loads",
+    "to_text",
+    "ORJSONResponse",
 ]
\ No newline at end of file
@@ -2,21 +2,69 @@
 Utilities for function inspection and schema generation.
 """
 
+import functools
 import inspect
-from typing import Any, Callable, Dict, get_type_hints
+import types
+import weakref
+from collections.abc import Callable
+from typing import Any, TypeVar, Union, get_args, get_origin, get_type_hints
 
+from starlette.concurrency import run_in_threadpool
 
-def get_parameter_schema(func: Callable) -> Dict[str, Any]:
+
+_T = TypeVar("_T")
+
+
+def _memoize_per_function(builder: Callable[[Callable], _T]) -> Callable[[Callable], _T]:
+    """Cache builder(func) for as long as func is alive"""
+    cache: weakref.WeakKeyDictionary[Callable, _T] = weakref.WeakKeyDictionary()
+    
+    @functools.wraps(builder)
+    def wrapper(func: Callable) -> _T:
+        try:
+            return cache[func]
+        except KeyError:
+            value = cache[func] = builder(func)
+            return value
+        except TypeError:
+            # Not weak-referenceable or unhashable: build every time
+            return builder(func)
+    
+    return wrapper
+
+
+@_memoize_per_function
+def get_signature(func: Callable) -> inspect.Signature:
+    """
+    inspect.signature(func), cached per function
+    
+    Args:
+        func: Function to inspect
+    
+    Returns:
+        The function's signature
+    
+    Raises:
+        TypeError, ValueError: If func has no retrievable signature
+    """
+    return inspect.signature(func)
+
+
+@_memoize_per_function
+def get_parameter_schema(func: Callable) -> dict[str, Any]:
     """
     Generate JSON schema for function parameters
     
+    The schema is cached per function and shared between callers; treat it
+    as read-only.
+    
     Args:
         func: Function to inspect
     
     Returns:
         JSON schema dictionary
     """
-    sig = inspect.signature(func)
+    sig = get_signature(func)
     properties = {}
     required = []
     
@@ -27,6 +75,8 @@ def get_parameter_schema(func: Callable) -> Dict[str, Any]:
         # Handle various exceptions that can occur during type hint extraction
         hints = {}
     
+    has_doc = bool(inspect.getdoc(func))
+    
     for param_name, param in sig.parameters.items():
         # Skip self and cls parameters
         if param_name in ('self', 'cls'):
@@ -36,8 +86,8 @@ def get_parameter_schema(func: Callable) -> Dict[str, Any]:
         param_type = "string"  # default
         
         # Check type hints first
-        if param_name in hints:
-            hint = hints[param_name]
+        hint = hints.get(param_name)
+        if hint is not None:
             param_type = _python_type_to_json_type(hint)
         # Fall back to annotation
         elif param.annotation != inspect.Parameter.empty:
@@ -48,8 +98,7 @@ def get_parameter_schema(func: Callable) -> Dict[str, Any]:
         }
         
         # Add description from docstring if available
-        doc = inspect.getdoc(func)
-        if doc:
+        if has_doc:
             # Simple extraction - could be enhanced
             properties[param_name]["description"] = f"Parameter {param_name}"
         
@@ -68,6 +117,22 @@ def get_parameter_schema(func: Callable) -> Dict[str, Any]:
     return schema
 
 
+# JSON schema type for builtin types and the origins of their generic aliases
+_JSON_TYPE_MAP = {
+    int: "integer",
+    float: "number",
+    bool: "boolean",
+    str: "string",
+    list: "array",
+    tuple: "array",
+    set: "array",
+    frozenset: "array",
+    dict: "object",
+}
+
+_UNION_TYPES = (Union, types.UnionType)
+
+
 def _python_type_to_json_type(python_type: Any) -> str:
     """
     Convert Python type to JSON schema type
@@ -79,44 +144,26 @@ def _python_type_to_json_type(python_type: Any) -> str:
         JSON schema type string
     """
     try:
-        # Handle basic types
-        if python_type == int:
-            return "integer"
-        elif python_type == float:
-            return "number"
-        elif python_type == bool:
-            return "boolean"
-        elif python_type == str:
-            return "string"
-        elif python_type == list:
-            return "array"
-        elif python_type == dict:
-            return "object"
-        
-        # Handle typing module types
-        type_str = str(python_type)
-        
-        if "list" in type_str.lower() or "List" in type_str:
-            return "array"
-        elif "dict" in type_str.lower() or "Dict" in type_str:
-            return "object"
-        elif "int" in type_str.lower():
-            return "integer"
-        elif "float" in type_str.lower():
-            return "number"
-        elif "bool" in type_str.lower():
-            return "boolean"
-        
-        # Default to string
-        return "string"
-    except Exception:
-        # Fallback to string if type conversion fails
+        json_type = _JSON_TYPE_MAP.get(python_type)
+    except TypeError:  # unhashable annotation
         return "string"
+    if json_type is not None:
+        return json_type
+    
+    # Generic aliases: List[int] -> list, Dict[str, Any] -> dict, ...
+    origin = get_origin(python_type)
+    if origin in _UNION_TYPES:
+        # Optional[X] maps like X; other unions fall back to string
+        args = [arg for arg in get_args(python_type) if arg is not type(None)]
+        return _python_type_to_json_type(args[0]) if len(args) == 1 else "string"
+    
+    return _JSON_TYPE_MAP.get(origin, "string")
 
 
+@_memoize_per_function
 def is_async_function(func: Callable) -> bool:
     """
-    Check if a function is async
+    Check if a function is async (cached per function)
     
     Args:
         func: Function to check
@@ -127,6 +174,38 @@ def is_async_function(func: Callable) -> bool:
     return inspect.iscoroutinefunction(func)
 
 
+def is_result_stream(result: Any) -> bool:
+    """
+    Check if a function result is a (sync or async) generator
+    
+    Args:
+        result: Value returned by a tool or resource function
+    
+    Returns:
+        True if the result should be consumed incrementally
+    """
+    return inspect.isgenerator(result) or inspect.isasyncgen(result)
+
+
+async def collect_result(result: Any) -> Any:
+    """
+    Materialize a generator result into a list; other values pass through
+    
+    Args:
+        result: Value returned by a tool or resource function
+    
+    Returns:
+        The result, with generators drained into a list
+    """
+    if inspect.isasyncgen(result):
+        return [item async for item in result]
+    if inspect.isgenerator(result):
+        # The generator body is the tool's work; keep it off the event loop
+        return await run_in_threadpool(list, result)
+    return result
+
+
+@_memoize_per_function
 def get_function_description(func: Callable) -> str:
     """
     Get function description from docstring
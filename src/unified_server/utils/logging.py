@@ -2,12 +2,78 @@
 Logging utilities for the unified server.
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
+import re
+import reprlib
 import sys
-from typing import Optional
+from typing import Any
 
 
-def setup_logging(level: str = "INFO", format_string: Optional[str] = None) -> logging.Logger:
+# C0 control characters (tab excepted) that could forge or split log lines
+_CONTROL_CHARS_RE = re.compile(r"[\x00-\x08\x0a-\x1f\x7f]")
+
+
+class ControlCharFilter(logging.Filter):
+    """
+    Strip control characters from log messages
+    
+    Runs only for records that pass the level check, so callers can log raw
+    user-supplied values with %-style arguments at no cost when suppressed.
+    """
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        message = record.getMessage()
+        if _CONTROL_CHARS_RE.search(message):
+            record.msg = _CONTROL_CHARS_RE.sub("", message)
+            record.args = None
+        return True
+
+
+_control_char_filter = ControlCharFilter()
+
+# Size-bounded repr for logging request payloads: large containers and
+# strings are elided while the repr is built, not sliced afterwards
+_payload_repr = reprlib.Repr()
+_payload_repr.maxlevel = 3
+_payload_repr.maxdict = 10
+_payload_repr.maxlist = 10
+_payload_repr.maxstring = 60
+_payload_repr.maxother = 60
+
+
+def payload_repr(obj: Any, limit: int = 200) -> str:
+    """
+    Short repr of a request payload for log messages
+    
+    Args:
+        obj: Value to describe (typically the request parameters)
+        limit: Maximum length of the result
+    
+    Returns:
+        repr of obj with nested items elided, at most limit characters
+    """
+    return _payload_repr.repr(obj)[:limit]
+
+
+# Background thread writing queued records to stdout (see setup_logging)
+_queue_listener: logging.handlers.QueueListener | None = None
+
+
+def _stop_queue_listener() -> None:
+    """Flush queued records and stop the background writer"""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
+
+
+def setup_logging(level: str = "INFO", format_string: str | None = None) -> logging.Logger:
     """
     Setup logging configuration
     
@@ -28,17 +94,29 @@ def setup_logging(level: str = "INFO", format_string: Optional[str] = None) -> l
         # Sanitize format string to prevent injection
         format_string = format_string.replace('\n', '').replace('\r', '')[:200]
     
+    global _queue_listener
+    _stop_queue_listener()
+    
     try:
+        # Callers only enqueue records; a listener thread does the stdout
+        # writes, so slow stdio never blocks a request. The QueueHandler
+        # formats records, and the stream handler writes them as-is.
+        log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        
         # Use only safe, predefined configurations
         logging.basicConfig(
             level=getattr(logging, safe_level, logging.INFO),
             format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',  # Fixed format
             datefmt='%Y-%m-%d %H:%M:%S',
             handlers=[
-                logging.StreamHandler(sys.stdout)
+                logging.handlers.QueueHandler(log_queue)
             ],
             force=True  # Override existing configuration
         )
+        _queue_listener = logging.handlers.QueueListener(
+            log_queue, logging.StreamHandler(sys.stdout)
+        )
+        _queue_listener.start()
     except Exception:
         # Fallback to minimal safe configuration
         logging.basicConfig(
@@ -62,4 +140,7 @@ def get_logger(name: str) -> logging.Logger:
     """
     # Sanitize logger name to prevent injection
     safe_name = name.replace('\n', '').replace('\r', '').replace('..', '')[:50]
-    return logging.getLogger(f"unified_server.{safe_name}")
\ No newline at end of file
+    logger = logging.getLogger(f"unified_server.{safe_name}")
+    if _control_char_filter not in logger.filters:
+        logger.addFilter(_control_char_filter)
+    return logger
\ No newline at end of file
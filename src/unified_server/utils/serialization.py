@@ -0,0 +1,63 @@
+"""
+JSON serialization helpers (orjson when available, stdlib json otherwise).
+"""
+
+import json
+from typing import Any
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson  # type: ignore[import-not-found]
+except ImportError:  # orjson is optional (pip install unified-mcp-server[speedups])
+    orjson = None  # type: ignore[assignment]
+
+
+def _default(obj: Any) -> Any:
+    """Fallback encoder for types the JSON backend does not handle natively"""
+    return jsonable_encoder(obj)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize obj to compact JSON bytes with the stdlib encoder"""
+    return json.dumps(
+        obj, default=_default, ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def dumps(obj: Any) -> bytes:
+        """
+        Serialize obj to compact JSON bytes
+        
+        Values orjson rejects (e.g. integers wider than 64 bits) are encoded
+        by the stdlib instead. Note that orjson writes NaN/Infinity as null.
+        """
+        try:
+            return orjson.dumps(obj, default=_default, option=_ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            return _json_dumps(obj)
+
+    loads = orjson.loads
+else:
+    dumps = _json_dumps
+    loads = json.loads
+
+
+def to_text(obj: Any) -> str:
+    """Render a handler result as text: JSON for containers, str() otherwise"""
+    if type(obj) is str:
+        return obj
+    if isinstance(obj, (dict, list, tuple)):
+        return dumps(obj).decode("utf-8")
+    return str(obj)
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson when it is installed"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -0,0 +1,74 @@
+"""
+Validation utilities for tool arguments and registration names.
+"""
+
+from collections.abc import Callable
+from typing import Any
+
+from .logging import get_logger
+
+try:
+    import fastjsonschema  # type: ignore[import-not-found]
+except ImportError:  # fastjsonschema is optional; fall back to jsonschema
+    fastjsonschema = None
+
+try:
+    import jsonschema  # type: ignore[import-untyped]
+except ImportError:  # without either backend, arguments are not schema-checked
+    jsonschema = None
+
+
+logger = get_logger("utils.validation")
+
+
+def compile_schema_validator(schema: dict[str, Any]) -> Callable[[Any], None] | None:
+    """
+    Compile a JSON schema into a reusable validator
+
+    Args:
+        schema: JSON schema dictionary
+
+    Returns:
+        Callable raising ValueError for invalid instances, or None if no
+        validation backend is installed or the schema cannot be compiled
+    """
+    try:
+        if fastjsonschema is not None:
+            compiled = fastjsonschema.compile(schema)
+
+            def validate(instance: Any) -> None:
+                try:
+                    compiled(instance)
+                except fastjsonschema.JsonSchemaValueException as e:
+                    raise ValueError(e.message) from None
+
+            return validate
+
+        if jsonschema is not None:
+            validator_cls = jsonschema.validators.validator_for(schema)
+            validator_cls.check_schema(schema)
+            validator = validator_cls(schema)
+
+            def validate(instance: Any) -> None:
+                error = jsonschema.exceptions.best_match(validator.iter_errors(instance))
+                if error is not None:
+                    raise ValueError(error.message)
+
+            return validate
+    except Exception as e:
+        logger.warning("Could not compile parameter schema: %s", str(e)[:100])
+
+    return None
+
+
+def is_valid_name(name: str) -> bool:
+    """
+    Check that a tool/resource/prompt name matches ^[a-zA-Z0-9_-]+$
+    
+    Uses str methods instead of the regex engine; this runs on every
+    request that addresses a registration by name.
+    """
+    if not name or not name.isascii():
+        return False
+    rest = name.replace("-", "").replace("_", "")
+    return not rest or rest.isalnum()
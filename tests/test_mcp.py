@@ -2,10 +2,13 @@
 Tests for MCP protocol functionality.
 """
 
+import asyncio
+import json
+
 import pytest
 from fastapi.testclient import TestClient
 
-from unified_server import UnifiedServer, tool, resource, prompt, registry
+from unified_server import UnifiedServer, tool, resource, resource_template, prompt, registry
 
 
 @pytest.fixture(autouse=True)
@@ -16,16 +19,17 @@ def clear_registry():
     registry.clear()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def server():
-    """Create test server"""
+    """Create test server (shared; routes read the registry per request)"""
     return UnifiedServer(name="test-server", version="1.0.0")
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client(server):
-    """Create test client"""
-    return TestClient(server.app)
+    """Create test client (lifespan runs once per module)"""
+    with TestClient(server.app) as test_client:
+        yield test_client
 
 
 def test_mcp_initialize(client):
@@ -140,7 +144,7 @@ def test_mcp_resources_read(client):
     
     assert response.status_code == 200
     data = response.json()
-    assert "{'name': 'TestApp'}" in data["result"]["contents"][0]["text"]
+    assert json.loads(data["result"]["contents"][0]["text"]) == {"name": "TestApp"}
 
 
 def test_mcp_resources_read_not_found(client):
@@ -211,4 +215,122 @@ def test_mcp_unknown_method(client):
     assert response.status_code == 200
     data = response.json()
     assert "error" in data
-    assert data["error"]["code"] == -32601
\ No newline at end of file
+    assert data["error"]["code"] == -32601
+
+
+def test_mcp_batch(client):
+    """Test MCP JSON-RPC batch request"""
+    @tool(description="Add numbers")
+    def add(a: int, b: int) -> int:
+        return a + b
+    
+    response = client.post("/mcp", json=[
+        {"jsonrpc": "2.0", "id": 1, "method": "tools/call",
+         "params": {"name": "add", "arguments": {"a": 1, "b": 2}}},
+        {"jsonrpc": "2.0", "id": 2, "method": "unknown/method", "params": {}},
+    ])
+    
+    assert response.status_code == 200
+    data = response.json()
+    assert [r["id"] for r in data] == [1, 2]
+    assert data[0]["result"]["content"][0]["text"] == "3"
+    assert data[1]["error"]["code"] == -32601
+
+
+def test_mcp_batch_runs_sync_handlers_off_event_loop(client):
+    """Test that sync tools, resources and prompts run in the threadpool"""
+    def on_loop() -> bool:
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        return True
+    
+    tool(name="on_loop", description="Event loop check")(on_loop)
+    resource(uri="test://on_loop", name="on_loop_resource")(on_loop)
+    prompt(name="on_loop_prompt")(on_loop)
+    
+    response = client.post("/mcp", json=[
+        {"jsonrpc": "2.0", "id": 1, "method": "tools/call",
+         "params": {"name": "on_loop", "arguments": {}}},
+        {"jsonrpc": "2.0", "id": 2, "method": "resources/read",
+         "params": {"uri": "test://on_loop"}},
+        {"jsonrpc": "2.0", "id": 3, "method": "prompts/get",
+         "params": {"name": "on_loop_prompt", "arguments": {}}},
+    ])
+    
+    assert response.status_code == 200
+    data = response.json()
+    assert data[0]["result"]["content"][0]["text"] == "False"
+    assert data[1]["result"]["contents"][0]["text"] == "False"
+    assert data[2]["result"]["messages"] is False
+
+
+def test_mcp_tools_list_sees_new_registrations(client):
+    """Test that cached listings are invalidated by new registrations"""
+    payload = {"jsonrpc": "2.0", "id": 1, "method": "tools/list", "params": {}}
+    assert client.post("/mcp", json=payload).json()["result"]["tools"] == []
+    
+    @tool(description="Late tool")
+    def late_tool() -> str:
+        return "late"
+    
+    tools = client.post("/mcp", json=payload).json()["result"]["tools"]
+    assert [t["name"] for t in tools] == ["late_tool"]
+
+
+def test_mcp_resources_read_template(client):
+    """Test MCP resources/read falling back to a resource template"""
+    @resource_template(uri_template="file://user/{user_id}/profile")
+    def user_profile(user_id: str):
+        return f"profile of {user_id}"
+    
+    response = client.post("/mcp", json={
+        "jsonrpc": "2.0",
+        "id": 12,
+        "method": "resources/read",
+        "params": {"uri": "file://user/42/profile"}
+    })
+    
+    assert response.status_code == 200
+    data = response.json()
+    assert data["result"]["contents"][0]["text"] == "profile of 42"
+
+
+def test_mcp_resource_templates_list(client):
+    """Test MCP resources/templates/list"""
+    @resource_template(uri_template="file://user/{user_id}/profile", description="User profile")
+    def user_profile(user_id: str):
+        return f"profile of {user_id}"
+    
+    response = client.post("/mcp", json={
+        "jsonrpc": "2.0",
+        "id": 13,
+        "method": "resources/templates/list"
+    })
+    
+    assert response.status_code == 200
+    templates = response.json()["result"]["resourceTemplates"]
+    assert len(templates) == 1
+    assert templates[0]["uriTemplate"] == "file://user/{user_id}/profile"
+    assert templates[0]["name"] == "user_profile"
+
+
+def test_mcp_websocket_batch(client):
+    """Test a JSON-RPC batch sent over the WebSocket transport"""
+    @tool(description="Add numbers")
+    def add(a: int, b: int) -> int:
+        return a + b
+    
+    with client.websocket_connect("/mcp/ws") as ws:
+        assert ws.receive_json()["type"] == "connection"
+        ws.send_text(json.dumps([
+            {"jsonrpc": "2.0", "id": 1, "method": "tools/call",
+             "params": {"name": "add", "arguments": {"a": 1, "b": 2}}},
+            {"jsonrpc": "2.0", "id": 2, "method": "ping"},
+        ]))
+        responses = ws.receive_json()
+    
+    assert [r["id"] for r in responses] == [1, 2]
+    assert responses[0]["result"]["content"][0]["text"] == "3"
+    assert responses[1]["result"] == {}
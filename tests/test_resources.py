@@ -2,10 +2,12 @@
 Tests for resource functionality.
 """
 
+import httpx
 import pytest
+import pytest_asyncio
 from fastapi.testclient import TestClient
 
-from unified_server import UnifiedServer, resource, registry
+from unified_server import UnifiedServer, resource, resource_template, registry
 
 
 @pytest.fixture(autouse=True)
@@ -16,16 +18,25 @@ def clear_registry():
     registry.clear()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def server():
-    """Create test server"""
+    """Create test server (shared; routes read the registry per request)"""
     return UnifiedServer(name="test-server", version="1.0.0")
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client(server):
-    """Create test client"""
-    return TestClient(server.app)
+    """Create test client (lifespan runs once per module)"""
+    with TestClient(server.app) as test_client:
+        yield test_client
+
+
+@pytest_asyncio.fixture
+async def async_client(server):
+    """Create async test client running requests on the test's event loop"""
+    transport = httpx.ASGITransport(app=server.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+        yield client
 
 
 def test_resource_registration():
@@ -95,13 +106,13 @@ def test_read_resource_not_found(client):
 
 
 @pytest.mark.asyncio
-async def test_async_resource(client):
+async def test_async_resource(async_client):
     """Test async resource"""
     @resource(uri="async://data", description="Async data")
     async def async_data():
         return {"async": True}
     
-    response = client.get("/resources/async_data")
+    response = await async_client.get("/resources/async_data")
     assert response.status_code == 200
     assert response.json()["content"] == {"async": True}
 
@@ -118,4 +129,57 @@ def test_resource_with_mime_type(client):
     
     response = client.get("/resources/json_data")
     assert response.status_code == 200
-    assert response.json()["mimeType"] == "application/json"
\ No newline at end of file
+    assert response.json()["mimeType"] == "application/json"
+
+
+def test_resource_template_resolve_and_match():
+    """Test resolving and reverse-matching a resource template URI"""
+    @resource_template(uri_template="file://user/{user_id}/posts/{post_id}")
+    def user_post(user_id: str, post_id: str):
+        return {"user_id": user_id, "post_id": post_id}
+    
+    info = registry.get_resource_template("user_post")
+    assert info.resolve_uri({"user_id": "7", "post_id": "42"}) == "file://user/7/posts/42"
+    assert info.resolve_uri({"user_id": "7"}) == "file://user/7/posts/{post_id}"
+    assert info.match_uri("file://user/7/posts/42") == {"user_id": "7", "post_id": "42"}
+    assert info.match_uri("file://user/7/comments/42") is None
+
+
+def test_match_resource_template_prefers_exact_segments():
+    """Test that literal segments win over placeholders when matching URIs"""
+    @resource_template(uri_template="file://user/{user_id}/profile")
+    def user_profile(user_id: str):
+        return user_id
+    
+    @resource_template(uri_template="file://user/me/profile")
+    def my_profile():
+        return "me"
+    
+    @resource_template(uri_template="file://item-{item_id}.json")
+    def item(item_id: str):
+        return item_id
+    
+    info, params = registry.match_resource_template("file://user/42/profile")
+    assert info.function is user_profile and params == {"user_id": "42"}
+    
+    info, params = registry.match_resource_template("file://user/me/profile")
+    assert info.function is my_profile and params == {}
+    
+    info, params = registry.match_resource_template("file://item-9.json")
+    assert info.function is item and params == {"item_id": "9"}
+    
+    assert registry.match_resource_template("file://user/42") is None
+
+
+def test_read_resource_batch(client):
+    """Test that batched resource reads keep the request order"""
+    @resource(uri="data://config")
+    def config():
+        return {"debug": True}
+    
+    response = client.post("/resources/batch", json=[{"name": "config"}, {"name": "missing"}])
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert results[0]["content"] == {"debug": True}
+    assert results[0]["uri"] == "data://config"
+    assert "error" in results[1]
@@ -0,0 +1,47 @@
+"""
+Tests for server construction.
+"""
+
+from fastapi.testclient import TestClient
+from starlette.middleware.cors import CORSMiddleware
+
+from unified_server import UnifiedServer, ServerConfig
+from unified_server.core.server import _config_routers
+
+
+def test_cors_disabled_adds_no_middleware():
+    """Test that no CORS middleware is installed when CORS is disabled"""
+    server = UnifiedServer(name="test-server", version="1.0.0")
+    
+    assert all(m.cls is not CORSMiddleware for m in server.app.user_middleware)
+
+
+def test_cors_enabled_handles_preflight():
+    """Test CORS preflight when CORS is enabled"""
+    config = ServerConfig(cors_enabled=True, cors_origins=["http://example.com"])
+    server = UnifiedServer(name="test-server", version="1.0.0", config=config)
+    client = TestClient(server.app)
+    
+    response = client.options(
+        "/health",
+        headers={
+            "Origin": "http://example.com",
+            "Access-Control-Request-Method": "GET",
+        },
+    )
+    assert response.status_code == 200
+    assert response.headers["access-control-allow-origin"] == "http://example.com"
+
+
+def test_config_routers_shared_per_config():
+    """Test that equal configs reuse routers and differing configs do not"""
+    config = ServerConfig(cors_enabled=True, cors_origins=["http://example.com"])
+    routers = _config_routers(config)
+    
+    same = ServerConfig(cors_enabled=True, cors_origins=["http://example.com"])
+    other = ServerConfig(cors_enabled=True, cors_origins=["http://other.com"])
+    assert _config_routers(same) is routers
+    assert _config_routers(other) is not routers
+    
+    server = UnifiedServer(name="test-server", version="2.0.0", config=config)
+    assert TestClient(server.app).get("/").json()["version"] == "2.0.0"
@@ -2,33 +2,50 @@
 Tests for tool functionality.
 """
 
+import asyncio
+import functools
+import json
+import math
+from typing import Dict, List, Optional
+
+import httpx
 import pytest
+import pytest_asyncio
 from fastapi.testclient import TestClient
 
 from unified_server import UnifiedServer, tool, registry
 
 
-@pytest.fixture(autouse=True)
+@pytest.fixture
 def clear_registry():
-    """Clear registry before each test"""
+    """Clear registry around tests that register tools"""
     registry.clear()
     yield
     registry.clear()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def server():
-    """Create test server"""
+    """Create test server (shared; routes read the registry per request)"""
     return UnifiedServer(name="test-server", version="1.0.0")
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client(server):
-    """Create test client"""
-    return TestClient(server.app)
+    """Create test client (lifespan runs once per module)"""
+    with TestClient(server.app) as test_client:
+        yield test_client
+
+
+@pytest_asyncio.fixture
+async def async_client(server):
+    """Create async test client running requests on the test's event loop"""
+    transport = httpx.ASGITransport(app=server.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+        yield client
 
 
-def test_tool_registration():
+def test_tool_registration(clear_registry):
     """Test tool registration"""
     @tool(description="Test tool")
     def test_func(x: int) -> int:
@@ -38,7 +55,7 @@ def test_tool_registration():
     assert registry.tools["test_func"].description == "Test tool"
 
 
-def test_tool_custom_name():
+def test_tool_custom_name(clear_registry):
     """Test tool with custom name"""
     @tool(name="custom_name", description="Custom named tool")
     def some_function(x: int) -> int:
@@ -48,7 +65,7 @@ def test_tool_custom_name():
     assert "some_function" not in registry.tools
 
 
-def test_list_tools(client):
+def test_list_tools(client, clear_registry):
     """Test listing tools via API"""
     @tool(description="Tool 1")
     def tool1(x: int) -> int:
@@ -62,11 +79,34 @@ def test_list_tools(client):
     assert response.status_code == 200
     data = response.json()
     assert len(data["tools"]) == 2
-    assert any(t["name"] == "tool1" for t in data["tools"])
-    assert any(t["name"] == "tool2" for t in data["tools"])
+    names = {t["name"] for t in data["tools"]}
+    assert names == {"tool1", "tool2"}
+
+
+def test_list_tools_conditional_get(client, clear_registry):
+    """Test that list responses carry an ETag that changes with the registry"""
+    @tool(description="Tool 1")
+    def tool1(x: int) -> int:
+        return x
+    
+    response = client.get("/tools")
+    etag = response.headers["etag"]
+    
+    response = client.get("/tools", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    
+    @tool(description="Tool 2")
+    def tool2(y: str) -> str:
+        return y
+    
+    response = client.get("/tools", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert len(response.json()["tools"]) == 2
 
 
-def test_execute_tool(client):
+def test_execute_tool(client, clear_registry):
     """Test executing a tool"""
     @tool(description="Add numbers")
     def add(a: int, b: int) -> int:
@@ -83,7 +123,7 @@ def test_execute_tool_not_found(client):
     assert response.status_code == 404
 
 
-def test_execute_tool_invalid_params(client):
+def test_execute_tool_invalid_params(client, clear_registry):
     """Test executing tool with invalid parameters"""
     @tool(description="Test tool")
     def test_tool(x: int) -> int:
@@ -93,19 +133,32 @@ def test_execute_tool_invalid_params(client):
     assert response.status_code == 400
 
 
+def test_execute_tool_rejects_bad_body(client, clear_registry):
+    """Test that non-object and oversized bodies are rejected"""
+    @tool(description="Echo text")
+    def echo(text: str) -> str:
+        return text
+    
+    response = client.post("/tools/echo", json=["hi"])
+    assert response.status_code == 422
+    
+    response = client.post("/tools/echo", json={"text": "x" * 20000})
+    assert response.status_code == 413
+
+
 @pytest.mark.asyncio
-async def test_async_tool(client):
+async def test_async_tool(async_client, clear_registry):
     """Test async tool execution"""
     @tool(description="Async tool")
     async def async_tool(x: int) -> int:
         return x * 2
     
-    response = client.post("/tools/async_tool", json={"x": 5})
+    response = await async_client.post("/tools/async_tool", json={"x": 5})
     assert response.status_code == 200
     assert response.json()["result"] == 10
 
 
-def test_tool_with_complex_schema(client):
+def test_tool_with_complex_schema(client, clear_registry):
     """Test tool with custom parameter schema"""
     @tool(
         description="Complex tool",
@@ -130,7 +183,22 @@ def test_tool_with_complex_schema(client):
     assert response.json()["result"] == 10
 
 
-def test_get_tool_info(client):
+def test_generated_schema_types(clear_registry):
+    """Test JSON types inferred from generic and optional annotations"""
+    @tool(description="Typed tool")
+    def typed(
+        items: List[int], mapping: Dict[str, int], limit: Optional[int] = None, flag: bool = False
+    ) -> int:
+        return 0
+    
+    properties = registry.tools["typed"].parameters["properties"]
+    assert properties["items"]["type"] == "array"
+    assert properties["mapping"]["type"] == "object"
+    assert properties["limit"]["type"] == "integer"
+    assert properties["flag"]["type"] == "boolean"
+
+
+def test_get_tool_info(client, clear_registry):
     """Test getting tool information"""
     @tool(description="Test tool")
     def test_tool(x: int, y: int) -> int:
@@ -141,4 +209,178 @@ def test_get_tool_info(client):
     data = response.json()
     assert data["name"] == "test_tool"
     assert data["description"] == "Test tool"
-    assert "parameters" in data
\ No newline at end of file
+    assert "parameters" in data
+
+
+def test_get_tool_info_reflects_reregistration(client, clear_registry):
+    """Test that cached tool info is rebuilt when the tool is replaced"""
+    @tool(name="greet", description="Old description")
+    def greet_v1(name: str) -> str:
+        return name
+    
+    assert client.get("/tools/greet").json()["description"] == "Old description"
+    
+    @tool(name="greet", description="New description")
+    def greet_v2(name: str) -> str:
+        return name
+    
+    assert client.get("/tools/greet").json()["description"] == "New description"
+
+
+def test_execute_generator_tool_streams_ndjson(client, clear_registry):
+    """Test that generator results are streamed as NDJSON"""
+    @tool(description="Count up")
+    def count(n: int):
+        for i in range(n):
+            yield {"i": i}
+    
+    response = client.post("/tools/count", json={"n": 3})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    assert [json.loads(line) for line in response.text.splitlines()] == [
+        {"i": 0}, {"i": 1}, {"i": 2}
+    ]
+
+
+def test_execute_tool_invalid_arguments(client, clear_registry):
+    """Test that explicit parameter schemas are enforced"""
+    @tool(
+        description="Echo text",
+        parameters={
+            "type": "object",
+            "properties": {"text": {"type": "string"}},
+            "required": ["text"]
+        }
+    )
+    def echo(text: str) -> str:
+        return text
+    
+    response = client.post("/tools/echo", json={"text": 5})
+    assert response.status_code == 400
+    
+    response = client.post("/tools/echo", json={"text": "hi"})
+    assert response.status_code == 200
+    assert response.json()["result"] == "hi"
+
+
+def test_frozen_registry_rejects_registration(client, clear_registry):
+    """Test that a frozen registry serves reads but rejects new tools"""
+    @tool(description="Add numbers")
+    def add(a: int, b: int) -> int:
+        return a + b
+    
+    registry.freeze()
+    
+    with pytest.raises(RuntimeError):
+        @tool(description="Late tool")
+        def late() -> str:
+            return "late"
+    
+    assert "late" not in registry.tools
+    response = client.post("/tools/add", json={"a": 1, "b": 2})
+    assert response.status_code == 200
+    assert response.json()["result"] == 3
+    
+    registry.clear()
+    assert not registry.frozen
+
+
+def test_sync_tool_runs_off_event_loop_thread(client, clear_registry):
+    """Test that sync tools are dispatched to the threadpool"""
+    @tool(description="Report whether an event loop runs in this thread")
+    def on_loop() -> bool:
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        return True
+    
+    response = client.post("/tools/on_loop", json={})
+    assert response.status_code == 200
+    assert response.json()["result"] is False
+    
+    @tool(description="Report from inside a generator body")
+    def on_loop_stream():
+        yield on_loop()
+    
+    response = client.post("/tools/on_loop_stream", json={})
+    assert response.status_code == 200
+    assert [json.loads(line) for line in response.text.splitlines()] == [False]
+    
+    response = client.post("/api/tools/on_loop_stream", json={"arguments": {}})
+    assert response.status_code == 200
+    assert response.json()["result"] == [False]
+    
+    response = client.post("/mcp", json={
+        "jsonrpc": "2.0", "id": 1, "method": "tools/call",
+        "params": {"name": "on_loop_stream", "arguments": {}},
+    })
+    assert response.json()["result"]["content"][0]["text"] == "[false]"
+
+
+def test_execute_tool_batch(client, clear_registry):
+    """Test that batched tool calls report results and errors in order"""
+    @tool(description="Add numbers")
+    def add(a: int, b: int) -> int:
+        return a + b
+    
+    @tool(description="Async double")
+    async def double(x: int) -> int:
+        return x * 2
+    
+    response = client.post("/tools/batch", json=[
+        {"name": "add", "params": {"a": 1, "b": 2}},
+        {"name": "double", "params": {"x": 4}},
+        {"name": "missing"},
+    ])
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert results[0] == {"name": "add", "result": 3}
+    assert results[1] == {"name": "double", "result": 8}
+    assert results[2]["name"] == "missing" and "error" in results[2]
+    
+    assert client.post("/tools/batch", json=[]).status_code == 400
+
+
+def test_execute_wrapped_tool(client, clear_registry):
+    """Test a tool behind a functools.wraps decorator taking **kwargs"""
+    def logged(func):
+        @functools.wraps(func)
+        def wrapper(**kwargs):
+            return func(**kwargs)
+        return wrapper
+    
+    @tool(description="Add numbers")
+    @logged
+    def addw(a: int, b: int) -> int:
+        return a + b
+    
+    response = client.post("/tools/addw", json={"a": 1, "b": 2})
+    assert response.status_code == 200
+    assert response.json()["result"] == 3
+    
+    response = client.post("/api/tools/addw", json={"arguments": {"a": 1, "b": 2}})
+    assert response.status_code == 200
+    assert response.json()["result"] == 3
+
+
+def test_execute_tool_unusual_numbers(client, clear_registry):
+    """Test results outside orjson's native range are still served"""
+    @tool(description="Factorial")
+    def fact(n: int) -> int:
+        return math.factorial(n)
+    
+    @tool(description="Not a number")
+    def nan() -> float:
+        return float("nan")
+    
+    response = client.post("/tools/fact", json={"n": 25})
+    assert response.status_code == 200
+    assert response.json()["result"] == math.factorial(25)
+    
+    response = client.post("/api/tools/fact", json={"arguments": {"n": 25}})
+    assert response.status_code == 200
+    assert response.json()["result"] == math.factorial(25)
+    
+    assert client.post("/tools/nan", json={}).status_code == 200
+    assert client.post("/api/tools/nan", json={"arguments": {}}).status_code == 200
@@ -2,34 +2,35 @@ from fastmcp import Client
 import asyncio
 
 async def main():
-    client = Client("http://localhost:8002/mcp")  
+    client = Client("http://localhost:8002/mcp")
     async with client:
-        
-        # Call your list_tables tool
-        result = await client.call_tool("list_tables", {
-            "db_type": "postgres", 
-            "db_name": "kmp"
-        })
-        print("Database tables:", result.content[0].text)
-        
-        # Call your add tool
-        result = await client.call_tool("add", {
-            "a": 15, 
-            "b": 27
-        })
-        print("Addition result:", result.content[0].text)
-        
-        # Call your analyze_sentiment tool
-        result = await client.call_tool("analyze_sentiment", {
-            "text": "This is a great tool!"
-        })
-        print("Sentiment analysis:", result.content[0].text)
-        
-        # Call your search tool
-        result = await client.call_tool("search", {
-            "query": "python programming",
-            "max_results": 3
-        })
-        print("Search results:", result.content[0].text)
+
+        # The calls are independent, so issue them concurrently
+        tables, addition, sentiment, search = await asyncio.gather(
+            # Call your list_tables tool
+            client.call_tool("list_tables", {
+                "db_type": "postgres",
+                "db_name": "kmp"
+            }),
+            # Call your add tool
+            client.call_tool("add", {
+                "a": 15,
+                "b": 27
+            }),
+            # Call your analyze_sentiment tool
+            client.call_tool("analyze_sentiment", {
+                "text": "This is a great tool!"
+            }),
+            # Call your search tool
+            client.call_tool("search", {
+                "query": "python programming",
+                "max_results": 3
+            }),
+        )
+
+        print("Database tables:", tables.content[0].text)
+        print("Addition result:", addition.content[0].text)
+        print("Sentiment analysis:", sentiment.content[0].text)
+        print("Search results:", search.content[0].text)
 
 asyncio.run(main())
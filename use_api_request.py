@@ -1,14 +1,24 @@
-import requests
+import httpx
 
-# Call tools via REST API
-response = requests.post("http://localhost:8002/api/tools/add", 
-                        json={"arguments": {"a": 15, "b": 27}})
-print("Addition:", response.json())
+# One client for every call below: a single pooled keep-alive connection.
+# With the optional h2 package installed, HTTP/2 is negotiated for https://
+# servers that support it; plain http:// (as here) stays on HTTP/1.1.
+try:
+    import h2  # noqa: F401
+    http2 = True
+except ImportError:
+    http2 = False
 
-response = requests.post("http://localhost:8002/api/tools/list_tables", 
-                        json={"arguments": {"db_type": "postgres", "db_name": "kmp"}})
-print("Tables:", response.json())
+with httpx.Client(base_url="http://localhost:8002", http2=http2) as client:
+    # Call tools via REST API
+    response = client.post("/api/tools/add",
+                           json={"arguments": {"a": 15, "b": 27}})
+    print("Addition:", response.json())
 
-# Get resources
-response = requests.get("http://localhost:8002/api/resources/get_config")
-print("Config:", response.json())
+    response = client.post("/api/tools/list_tables",
+                           json={"arguments": {"db_type": "postgres", "db_name": "kmp"}})
+    print("Tables:", response.json())
+
+    # Get resources
+    response = client.get("/api/resources/get_config")
+    print("Config:", response.json())